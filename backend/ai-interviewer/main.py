@@ -8,11 +8,19 @@ from langchain.chains import LLMChain
 import os
 from dotenv import load_dotenv
 import PyPDF2 as pdf
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
 from pydantic import BaseModel
 import json
 import traceback
 import re
+import asyncio
+import uuid
+import hashlib
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 
 load_dotenv()
 
@@ -60,6 +68,49 @@ def extract_text(uploaded_file):
     except Exception as e:
         return f"Error extracting text: {str(e)}"
 
+# Condensed resume profiles keyed by the sha256 of the extracted resume text.
+resume_profile_cache: Dict[str, str] = {}
+PROFILE_FIELDS = ["name", "skills", "roles", "projects", "education"]
+RAW_RESUME_FALLBACK_CHARS = 3000
+
+async def build_resume_profile(resume_content: str) -> str:
+    resume_hash = hashlib.sha256(resume_content.encode("utf-8")).hexdigest()
+    if resume_hash in resume_profile_cache:
+        return resume_profile_cache[resume_hash]
+
+    profile_prompt = f"""
+Condense this resume into a compact JSON profile. Use short phrases, no full sentences.
+Return ONLY JSON with keys: "name" (string), "skills" (list), "roles" (list of "title, company, years"), "projects" (list of "name: stack, one-line outcome"), "education" (list).
+
+Resume:
+{resume_content}
+"""
+    try:
+        profile_raw = (await feedback_llm.ainvoke(profile_prompt)).content
+        json_match = re.search(r'\{[\s\S]*\}', profile_raw)
+        if not json_match:
+            raise ValueError("No valid JSON found in LLM response")
+        profile_dict = json.loads(json_match.group(0))
+
+        lines = []
+        for field in PROFILE_FIELDS:
+            value = profile_dict.get(field)
+            if not value:
+                continue
+            if isinstance(value, list):
+                value = "; ".join(str(item) for item in value)
+            lines.append(f"{field.capitalize()}: {value}")
+        if not lines:
+            raise ValueError("Resume profile is empty")
+        profile = "\n".join(lines)
+    except Exception:
+        print(f"Error building resume profile: {traceback.format_exc()}")
+        # Fall back to whitespace-collapsed raw text; not cached so a later upload retries.
+        return " ".join(resume_content.split())[:RAW_RESUME_FALLBACK_CHARS]
+
+    resume_profile_cache[resume_hash] = profile
+    return profile
+
 class HireBot:
     def __init__(self):
         self.memory = ConversationBufferMemory(
@@ -94,91 +145,141 @@ class HireBot:
             prompt=self.prompt,
             memory=self.memory,
         )
+        self.session_id = None
         self.resume_content = ""
-
-    def initialize_with_resume(self, resume_content: str) -> str:
-        self.resume_content = resume_content
-        formatted_system_prompt = self.system_prompt_template.format(resume_content=resume_content)
+        self.resume_profile = ""
+        self.turn_count = 0
+        self.turn_scores = []
+        self.pending_turns = []
+        self.scoring_tasks = set()
+        self.version = 0
+
+    def apply_resume_profile(self):
+        formatted_system_prompt = self.system_prompt_template.format(resume_content=self.resume_profile)
         self.prompt = ChatPromptTemplate.from_messages([
             ("system", formatted_system_prompt),
             MessagesPlaceholder(variable_name="chat_history"),
             ("human", "{input}")
         ])
         self.conversation.prompt = self.prompt
+
+    def to_state(self) -> Dict:
+        return {
+            "resume_content": self.resume_content,
+            "resume_profile": self.resume_profile,
+            "messages": [
+                {"role": message.type, "content": message.content}
+                for message in self.memory.chat_memory.messages
+            ],
+            "turn_count": self.turn_count,
+        }
+
+    @classmethod
+    def from_state(cls, session_id: str, version: int, state: Dict, turn_scores: List[Dict]) -> "HireBot":
+        hirebot = cls()
+        hirebot.session_id = session_id
+        hirebot.version = version
+        hirebot.resume_content = state["resume_content"]
+        hirebot.resume_profile = state["resume_profile"]
+        hirebot.apply_resume_profile()
+        for message in state["messages"]:
+            if message["role"] == "human":
+                hirebot.memory.chat_memory.add_user_message(message["content"])
+            else:
+                hirebot.memory.chat_memory.add_ai_message(message["content"])
+        hirebot.turn_count = state["turn_count"]
+        hirebot.turn_scores = turn_scores
+        return hirebot
+
+    async def initialize_with_resume(self, resume_content: str) -> str:
+        self.resume_content = resume_content
+        self.resume_profile = await build_resume_profile(resume_content)
+        self.apply_resume_profile()
         
         initial_input = "Say Good Day!. Start the interview with a welcome message and an initial question based on the resume. Be very formal and professional. The question should be short and crisp"
-        response = self.conversation({"input": initial_input})
+        response = await self.conversation.ainvoke({"input": initial_input})
         return response['text']
 
-    def chat(self, user_input: str) -> str:
-        response = self.conversation({"input": user_input})
-        return response['text']
+    async def chat(self, user_input: str) -> str:
+        messages = self.memory.chat_memory.messages
+        question = messages[-1].content if messages else ""
+        response = await self.conversation.ainvoke({"input": user_input})
 
-    def generate_feedback(self) -> FeedbackResponse:
-        chat_history = self.memory.chat_memory.messages
-        
-        # Use f-string approach with double curly braces for JSON template
-        feedback_prompt = f"""
-You are a professional interview coach. Evaluate the job interview based on the resume and conversation history provided below. Provide accurate scores based on the content.
-
-Return ONLY a JSON object in this exact format:
-{{
-  "communication_skills": 7,
-  "technical_knowledge": 8,
-  "confidence_level": 6,
-  "overall_score": 7.0,
-  "detailed_feedback": "Candidate demonstrated clear communication skills when discussing their experience at XYZ Corp. Their technical knowledge of Python and React was evident from project descriptions. Confidence was moderate but could be improved when explaining complex concepts. Based on the resume, they have strong relevant experience as a Senior Developer."
-}}
-
-- Use integers 0-10 for communication_skills, technical_knowledge, and confidence_level
-- Calculate overall_score as the average of the three scores (float)
-- Keep detailed_feedback concise (1-2 paragraphs) and professional
-- Base evaluation on actual content, not random scores
-
-Resume:
-{self.resume_content}
+        self.turn_count += 1
+        self.pending_turns.append((self.turn_count, question, user_input))
+        return response['text']
 
-Conversation:
-{str(chat_history)}
+    def score_pending_turns(self):
+        # Score answers in the background so /feedback only has to aggregate.
+        # Called after the turn is saved, so a rejected turn never writes a score.
+        for turn, question, answer in self.pending_turns:
+            task = asyncio.create_task(self.score_turn(turn, question, answer))
+            self.scoring_tasks.add(task)
+            task.add_done_callback(self.scoring_tasks.discard)
+        self.pending_turns = []
+
+    def answered_turns(self) -> List[Tuple[int, str, str]]:
+        messages = self.memory.chat_memory.messages
+        turns = []
+        # The first human message is the kickoff prompt, not an answer.
+        for index, message in enumerate(messages[1:], start=1):
+            if message.type == "human":
+                turns.append((len(turns) + 1, messages[index - 1].content, message.content))
+        return turns
+
+    async def score_turn(self, turn: int, question: str, answer: str):
+        score_prompt = f"""
+Score one mock interview answer. Return ONLY JSON:
+{{"communication_skills": 0-10, "technical_knowledge": 0-10, "confidence_level": 0-10, "note": "one short sentence"}}
+
+Question: {question}
+Answer: {answer}
 """
-        
         try:
-            feedback_raw = feedback_llm.invoke(feedback_prompt).content
-            
-            # Extract JSON from response
-            json_match = re.search(r'\{[\s\S]*\}', feedback_raw)
-            if not json_match:
-                raise ValueError("No valid JSON found in LLM response")
-                
-            json_str = json_match.group(0)
-            feedback_dict = json.loads(json_str)
-            
-            # Validate required fields
-            required_fields = ["communication_skills", "technical_knowledge", 
-                            "confidence_level", "detailed_feedback"]
-            for field in required_fields:
-                if field not in feedback_dict:
-                    raise ValueError(f"Missing required field: {field}")
-            
-            # Calculate and validate scores
-            scores = [
-                feedback_dict["communication_skills"],
-                feedback_dict["technical_knowledge"],
-                feedback_dict["confidence_level"]
-            ]
-            for score in scores:
-                if not isinstance(score, int) or score < 0 or score > 10:
-                    raise ValueError("Scores must be integers between 0-10")
-                    
+            score_raw = (await feedback_llm.ainvoke(score_prompt)).content
+            score_dict = parse_score_json(score_raw)
+            score_dict["turn"] = turn
+            self.turn_scores.append(score_dict)
+            if self.session_id:
+                await session_store.add_turn_score(self.session_id, score_dict)
+        except Exception:
+            print(f"Error scoring turn {turn}: {traceback.format_exc()}")
+
+    async def wait_for_scores(self):
+        if self.scoring_tasks:
+            await asyncio.gather(*list(self.scoring_tasks), return_exceptions=True)
+
+    async def generate_feedback(self) -> FeedbackResponse:
+        await self.wait_for_scores()
+        # Turns scored by another worker are loaded with the session; any still
+        # missing (in flight elsewhere, or lost with a worker) are scored here.
+        scored = {item["turn"] for item in self.turn_scores}
+        missing = [turn for turn in self.answered_turns() if turn[0] not in scored]
+        if missing:
+            await asyncio.gather(*(self.score_turn(*turn) for turn in missing))
+
+        try:
+            if not self.turn_scores:
+                raise ValueError("No interview answers have been scored yet")
+
+            by_turn = {item["turn"]: item for item in self.turn_scores}
+            turn_scores = [by_turn[turn] for turn in sorted(by_turn)]
+            averages = {
+                field: round(sum(item[field] for item in turn_scores) / len(turn_scores))
+                for field in SCORE_FIELDS
+            }
+            scores = [averages[field] for field in SCORE_FIELDS]
             overall_score = float(sum(scores)) / len(scores)
-            feedback_dict["overall_score"] = overall_score
-            
+
+            notes = "\n".join(f"- {item['note']}" for item in turn_scores if item.get("note"))
+            detailed_feedback = await self.synthesize_feedback(averages, notes)
+
             return FeedbackResponse(
-                communication_skills=feedback_dict["communication_skills"],
-                technical_knowledge=feedback_dict["technical_knowledge"],
-                confidence_level=feedback_dict["confidence_level"],
-                overall_score=feedback_dict["overall_score"],
-                detailed_feedback=feedback_dict["detailed_feedback"]
+                communication_skills=averages["communication_skills"],
+                technical_knowledge=averages["technical_knowledge"],
+                confidence_level=averages["confidence_level"],
+                overall_score=overall_score,
+                detailed_feedback=detailed_feedback
             )
         except Exception as e:
             error_details = traceback.format_exc()
@@ -191,8 +292,224 @@ Conversation:
                 detailed_feedback=f"Unable to generate feedback due to error: {str(e)}"
             )
 
-hirebot_instances: Dict[str, HireBot] = {}
-sample_bot = HireBot()
+    async def synthesize_feedback(self, averages: Dict[str, int], notes: str) -> str:
+        synthesis_prompt = f"""
+You are a professional interview coach. Write concise, professional interview feedback (1 paragraph) from these per-answer notes and average scores (0-10). Return only the feedback text.
+
+Scores: {json.dumps(averages)}
+Notes:
+{notes}
+"""
+        try:
+            return (await feedback_llm.ainvoke(synthesis_prompt)).content.strip()
+        except Exception:
+            print(f"Error in feedback synthesis: {traceback.format_exc()}")
+            return notes.replace("- ", "").replace("\n", " ")
+
+SCORE_FIELDS = ["communication_skills", "technical_knowledge", "confidence_level"]
+
+def parse_score_json(raw: str) -> Dict:
+    json_match = re.search(r'\{[\s\S]*\}', raw)
+    if not json_match:
+        raise ValueError("No valid JSON found in LLM response")
+    score_dict = json.loads(json_match.group(0))
+
+    for field in SCORE_FIELDS:
+        score = score_dict.get(field)
+        if not isinstance(score, int) or score < 0 or score > 10:
+            raise ValueError(f"{field} must be an integer between 0-10")
+    score_dict["note"] = str(score_dict.get("note", ""))
+    return score_dict
+
+SESSION_CACHE_SIZE = 500
+
+class SessionConflictError(Exception):
+    """The session was saved by another request since it was loaded."""
+
+class SessionStore(ABC):
+    """Interface for interview session persistence shared by all workers.
+
+    save() is a compare-and-swap on the version the HireBot was loaded at and
+    raises SessionConflictError if another worker saved the session first.
+    open() is called once on startup, before any other method.
+    """
+
+    @abstractmethod
+    def open(self):
+        ...
+
+    @abstractmethod
+    async def get(self, session_id: str) -> Optional[HireBot]:
+        ...
+
+    @abstractmethod
+    async def save(self, session_id: str, hirebot: HireBot):
+        ...
+
+    @abstractmethod
+    async def add_turn_score(self, session_id: str, score: Dict):
+        ...
+
+    @abstractmethod
+    async def exists(self, session_id: str) -> bool:
+        ...
+
+    @abstractmethod
+    async def count(self) -> int:
+        ...
+
+class SqliteSessionStore(SessionStore):
+    """Sqlite-backed sessions with an in-process read-through cache.
+
+    Every state write bumps the row version, and only succeeds against the
+    version it was loaded at. A cached HireBot is reused only while the
+    version and the number of stored turn scores still match the database,
+    so a turn or score written by another worker is picked up on the next
+    read. The cache keeps the SESSION_CACHE_SIZE most recently used sessions.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.cache: "OrderedDict[str, Tuple[Tuple[int, int], HireBot]]" = OrderedDict()
+
+    def open(self):
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS sessions (
+                    session_id TEXT PRIMARY KEY,
+                    version INTEGER NOT NULL,
+                    state TEXT NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS turn_scores (
+                    session_id TEXT NOT NULL,
+                    turn INTEGER NOT NULL,
+                    score TEXT NOT NULL,
+                    PRIMARY KEY (session_id, turn)
+                )
+            """)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _remember(self, session_id: str, fingerprint: Tuple[int, int], hirebot: HireBot):
+        self.cache[session_id] = (fingerprint, hirebot)
+        self.cache.move_to_end(session_id)
+        if len(self.cache) > SESSION_CACHE_SIZE:
+            self.cache.popitem(last=False)
+
+    def _fingerprint(self, conn: sqlite3.Connection, session_id: str) -> Optional[Tuple[int, int]]:
+        # (state version, stored turn scores) identifies what a cached HireBot holds.
+        row = conn.execute(
+            "SELECT version, (SELECT COUNT(*) FROM turn_scores WHERE session_id = ?) FROM sessions WHERE session_id = ?",
+            (session_id, session_id)
+        ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def _read_fingerprint(self, session_id: str) -> Optional[Tuple[int, int]]:
+        with self._connect() as conn:
+            return self._fingerprint(conn, session_id)
+
+    def _read_session(self, session_id: str) -> Optional[Tuple[int, Dict, List[Dict]]]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT version, state FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+            if not row:
+                return None
+            score_rows = conn.execute(
+                "SELECT score FROM turn_scores WHERE session_id = ? ORDER BY turn", (session_id,)
+            ).fetchall()
+        return row[0], json.loads(row[1]), [json.loads(score_row[0]) for score_row in score_rows]
+
+    def _write_session(self, session_id: str, state: Dict, expected_version: int) -> Optional[int]:
+        """Write state if the stored version is still expected_version (0 for a new
+        session); returns the new version, or None if another write got there first."""
+        with self._connect() as conn:
+            if expected_version == 0:
+                written = conn.execute(
+                    "INSERT OR IGNORE INTO sessions (session_id, version, state, updated_at) VALUES (?, 1, ?, ?)",
+                    (session_id, json.dumps(state), time.time())
+                ).rowcount
+            else:
+                written = conn.execute(
+                    "UPDATE sessions SET version = version + 1, state = ?, updated_at = ? WHERE session_id = ? AND version = ?",
+                    (json.dumps(state), time.time(), session_id, expected_version)
+                ).rowcount
+        return expected_version + 1 if written else None
+
+    def _write_turn_score(self, session_id: str, score: Dict) -> Optional[Tuple[int, int]]:
+        # Scores live in their own table and don't bump the session version,
+        # so a late score never makes the next turn's save conflict.
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO turn_scores (session_id, turn, score) VALUES (?, ?, ?)",
+                (session_id, score["turn"], json.dumps(score))
+            )
+            return self._fingerprint(conn, session_id)
+
+    async def get(self, session_id: str) -> Optional[HireBot]:
+        fingerprint = await asyncio.to_thread(self._read_fingerprint, session_id)
+        if fingerprint is None:
+            self.cache.pop(session_id, None)
+            return None
+        cached = self.cache.get(session_id)
+        if cached and cached[0] == fingerprint:
+            self.cache.move_to_end(session_id)
+            return cached[1]
+
+        loaded = await asyncio.to_thread(self._read_session, session_id)
+        if loaded is None:
+            return None
+        version, state, turn_scores = loaded
+        hirebot = HireBot.from_state(session_id, version, state, turn_scores)
+        self._remember(session_id, (version, len(turn_scores)), hirebot)
+        return hirebot
+
+    async def save(self, session_id: str, hirebot: HireBot):
+        hirebot.session_id = session_id
+        version = await asyncio.to_thread(self._write_session, session_id, hirebot.to_state(), hirebot.version)
+        if version is None:
+            # The in-memory bot holds a turn that was not stored; drop it.
+            self.cache.pop(session_id, None)
+            raise SessionConflictError(session_id)
+        hirebot.version = version
+        self._remember(session_id, (version, len(hirebot.turn_scores)), hirebot)
+
+    async def add_turn_score(self, session_id: str, score: Dict):
+        fingerprint = await asyncio.to_thread(self._write_turn_score, session_id, score)
+        cached = self.cache.get(session_id)
+        # The cached bot already holds this score; keep it valid unless
+        # another worker wrote in between.
+        if fingerprint is not None and cached and cached[0] == (fingerprint[0], fingerprint[1] - 1):
+            self.cache[session_id] = (fingerprint, cached[1])
+
+    async def exists(self, session_id: str) -> bool:
+        return await asyncio.to_thread(self._read_fingerprint, session_id) is not None
+
+    async def count(self) -> int:
+        def _count() -> int:
+            with self._connect() as conn:
+                return conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+        return await asyncio.to_thread(_count)
+
+session_store: SessionStore = SqliteSessionStore(
+    os.getenv("HIREBOT_SESSION_DB", "hirebot_sessions.db")
+)
+
+@app.on_event("startup")
+async def open_session_store():
+    # Created on startup rather than import, so importing main writes no files.
+    session_store.open()
+# One lock per session keeps the turns of a single interview ordered within
+# this worker while different interviews proceed concurrently; across workers
+# the store's compare-and-swap rejects interleaved turns. Locks are dropped
+# once no request holds or waits for them.
+session_locks: Dict[str, asyncio.Lock] = {}
+session_lock_users: Dict[str, int] = {}
 sample_resume = """
 John Doe
 Software Engineer
@@ -212,8 +529,63 @@ Bachelor of Science in Computer Science, University Example (2011-2015)
 SKILLS
 Python, JavaScript, React, Node.js, SQL, Git, Docker
 """
-sample_bot.initialize_with_resume(sample_resume)
-hirebot_instances["s1"] = sample_bot
+
+# Every demo visitor gets a fresh session copied from one opening (resume
+# profile and welcome question) built once per worker, on first use or
+# ahead of time by the optional warmup task (HIREBOT_WARMUP=1). Startup does
+# no network I/O.
+sample_template: Dict = {}
+sample_template_lock = asyncio.Lock()
+warmup_state = {"status": "disabled", "error": None}
+
+@asynccontextmanager
+async def session_lock(session_id: str):
+    lock = session_locks.setdefault(session_id, asyncio.Lock())
+    session_lock_users[session_id] = session_lock_users.get(session_id, 0) + 1
+    try:
+        async with lock:
+            yield
+    finally:
+        session_lock_users[session_id] -= 1
+        if not session_lock_users[session_id]:
+            del session_lock_users[session_id]
+            del session_locks[session_id]
+
+async def get_sample_template() -> Dict:
+    async with sample_template_lock:
+        if not sample_template:
+            sample_bot = HireBot()
+            await sample_bot.initialize_with_resume(sample_resume)
+            sample_template.update(sample_bot.to_state())
+    return sample_template
+
+async def warmup_sample_session():
+    warmup_state["status"] = "running"
+    try:
+        await get_sample_template()
+        warmup_state["status"] = "ready"
+    except Exception as e:
+        print(f"Error warming up sample interview: {traceback.format_exc()}")
+        warmup_state["status"] = "failed"
+        warmup_state["error"] = str(e)
+
+async def require_session(session_id: str):
+    # Reject unknown ids before a lock is allocated for them.
+    if not await session_store.exists(session_id):
+        raise HTTPException(status_code=404, detail="Session not found")
+
+async def get_hirebot(session_id: str) -> HireBot:
+    # Callers must hold the session lock.
+    hirebot = await session_store.get(session_id)
+    if hirebot is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+    return hirebot
+
+@app.on_event("startup")
+async def schedule_warmup():
+    if os.getenv("HIREBOT_WARMUP", "").lower() in ("1", "true", "yes"):
+        warmup_state["status"] = "pending"
+        app.state.warmup_task = asyncio.create_task(warmup_sample_session())
 
 @app.get("/", response_class=HTMLResponse)
 async def root():
@@ -254,6 +626,11 @@ async def root():
                 <p>Upload a resume PDF to initialize the interview session and receive the first question.</p>
             </div>
 
+            <div class="endpoint">
+                <h2>POST /demo-session</h2>
+                <p>Start a demo interview on a sample resume. Returns a new session ID and the first question.</p>
+            </div>
+
             <div class="endpoint">
                 <h2>POST /chat/{session_id}</h2>
                 <p>Chat with the AI interviewer using the session ID from resume upload.</p>
@@ -264,6 +641,11 @@ async def root():
                 <p>Get structured feedback on your interview performance based on the conversation.</p>
             </div>
 
+            <div class="endpoint">
+                <h2>GET /ready</h2>
+                <p>Readiness probe. Reports the state of the optional demo-interview warmup.</p>
+            </div>
+
             <p>Check <code>/docs</code> for detailed API documentation and interactive testing.</p>
         </body>
     </html>
@@ -274,15 +656,16 @@ async def upload_resume(file: UploadFile = File(...)):
     if not file.filename.endswith('.pdf'):
         raise HTTPException(status_code=400, detail="Only PDF files are supported")
     
-    session_id = "s1"
-    content = extract_text(file.file)
+    session_id = uuid.uuid4().hex
+    content = await asyncio.to_thread(extract_text, file.file)
     
     if "Error" in content:
         raise HTTPException(status_code=500, detail=content)
     
     hirebot = HireBot()
-    initial_question = hirebot.initialize_with_resume(content)
-    hirebot_instances[session_id] = hirebot
+    async with session_lock(session_id):
+        initial_question = await hirebot.initialize_with_resume(content)
+        await session_store.save(session_id, hirebot)
     
     return {
         "message": "Resume uploaded successfully",
@@ -290,22 +673,42 @@ async def upload_resume(file: UploadFile = File(...)):
         "initial_question": initial_question
     }
 
+@app.post("/demo-session")
+async def start_demo_session():
+    template = await get_sample_template()
+    session_id = uuid.uuid4().hex
+    hirebot = HireBot.from_state(session_id, 0, template, [])
+    async with session_lock(session_id):
+        await session_store.save(session_id, hirebot)
+
+    return {
+        "message": "Demo session started",
+        "session_id": session_id,
+        "initial_question": template["messages"][-1]["content"]
+    }
+
 @app.post("/chat/{session_id}")
 async def chat_with_interviewer(session_id: str, request: ChatRequest):
-    if session_id not in hirebot_instances:
-        raise HTTPException(status_code=404, detail="Session not found")
-    
-    hirebot = hirebot_instances[session_id]
-    response = hirebot.chat(request.message)
+    await require_session(session_id)
+    async with session_lock(session_id):
+        hirebot = await get_hirebot(session_id)
+        response = await hirebot.chat(request.message)
+        try:
+            await session_store.save(session_id, hirebot)
+        except SessionConflictError:
+            raise HTTPException(status_code=409, detail="This interview was updated by another request; please resend your answer")
+        hirebot.score_pending_turns()
     return {"response": response}
 
 @app.get("/feedback/{session_id}", response_model=FeedbackResponse)
 async def get_feedback(session_id: str):
-    if session_id not in hirebot_instances:
-        raise HTTPException(status_code=404, detail="Session not found")
-    
-    hirebot = hirebot_instances[session_id]
-    feedback = hirebot.generate_feedback()
+    await require_session(session_id)
+    async with session_lock(session_id):
+        hirebot = await get_hirebot(session_id)
+        await hirebot.wait_for_scores()
+        # Re-read to pick up scores stored by this or another worker meanwhile.
+        hirebot = await get_hirebot(session_id)
+        feedback = await hirebot.generate_feedback()
     
     return JSONResponse(content={
         "communication_skills": feedback.communication_skills,
@@ -315,6 +718,15 @@ async def get_feedback(session_id: str):
         "detailed_feedback": feedback.detailed_feedback
     })
 
+@app.get("/ready")
+async def readiness():
+    return {
+        "ready": True,
+        "warmup": warmup_state["status"],
+        "warmup_error": warmup_state["error"],
+        "sessions": await session_store.count()
+    }
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="localhost", port=8001)
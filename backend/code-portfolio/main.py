@@ -1,15 +1,27 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse  
+from fastapi.responses import HTMLResponse, StreamingResponse
 from pydantic import BaseModel
-import requests
-from bs4 import BeautifulSoup
+import httpx
+from lxml import etree
 from selenium import webdriver
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from urllib.parse import quote, urlsplit
+from typing import Callable, Dict, List, Optional, Tuple
+from collections import OrderedDict
+from contextvars import ContextVar
+import asyncio
+import heapq
+import itertools
+import json
+import random
+import sqlite3
 import time
 import uvicorn
 import os
-import uvicorn
 
 app = FastAPI()
 
@@ -24,6 +36,69 @@ app.add_middleware(
 class UsernameRequest(BaseModel):
     username: str
 
+class ProfileRequest(BaseModel):
+    leetcode: Optional[str] = None
+    codeforces: Optional[str] = None
+    codechef: Optional[str] = None
+    geeksforgeeks: Optional[str] = None
+    codingninjas: Optional[str] = None
+
+class UsernamesRequest(BaseModel):
+    usernames: List[str]
+
+class CohortStudent(ProfileRequest):
+    name: str
+
+class CohortRequest(BaseModel):
+    students: List[CohortStudent]
+
+class TrackRequest(BaseModel):
+    platform: str
+    username: str
+
+BROWSER_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+
+# Local sqlite file shared by the profile cache, the Codeforces sync state and
+# tracked profiles. It is created on startup, so importing main (e.g. from
+# benchmark_parsing.py) leaves no database behind.
+PROFILE_DB_PATH = os.getenv("PROFILE_CACHE_DB", "profile_cache.db")
+
+@app.on_event("startup")
+async def open_profile_db():
+    for store in (codeforces_sync_store, profile_cache, tracked_store):
+        store.open()
+
+# One pooled keep-alive client is shared by every platform fetcher.
+HTTP_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0)
+MAX_CONNECTIONS_PER_HOST = 10
+
+http_client: httpx.AsyncClient = None
+host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+@app.on_event("startup")
+async def open_http_client():
+    global http_client
+    http_client = httpx.AsyncClient(timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS, follow_redirects=True)
+
+@app.on_event("shutdown")
+async def close_http_client():
+    await http_client.aclose()
+
+async def http_request(method: str, url: str, **kwargs) -> httpx.Response:
+    host = urlsplit(url).netloc
+    if host not in host_semaphores:
+        host_semaphores[host] = asyncio.Semaphore(MAX_CONNECTIONS_PER_HOST)
+    async with host_semaphores[host]:
+        try:
+            return await http_client.request(method, url, **kwargs)
+        except httpx.TimeoutException:
+            raise HTTPException(status_code=504, detail=f"Timed out fetching {host}")
+        except httpx.HTTPError as e:
+            raise HTTPException(status_code=502, detail=f"Error fetching {host}: {str(e)}")
+
 # Root Endpoint
 @app.get("/", response_class=HTMLResponse)
 async def root():
@@ -66,6 +141,12 @@ async def root():
                 <p><strong>Request Body:</strong> <code>{"username": "your_leetcode_username"}</code></p>
             </div>
 
+            <div class="endpoint">
+                <h2>POST /leetcode/batch</h2>
+                <p>Get LeetCode stats for many users. Uncached users are fetched together in batched GraphQL requests. At most 100 usernames per request.</p>
+                <p><strong>Request Body:</strong> <code>{"usernames": ["user1", "user2"]}</code></p>
+            </div>
+
             <div class="endpoint">
                 <h2>POST /codeforces</h2>
                 <p>Get the number of unique problems solved on Codeforces.</p>
@@ -80,8 +161,8 @@ async def root():
 
             <div class="endpoint">
                 <h2>POST /codingninjas</h2>
-                <p>Get the number of questions solved from a fixed Coding Ninjas profile (UI accepts username).</p>
-                <p><strong>Request Body:</strong> <code>{"username": "any_username"}</code></p>
+                <p>Get the number of questions solved from a Coding Ninjas (Code360) profile.</p>
+                <p><strong>Request Body:</strong> <code>{"username": "your_code360_username"}</code></p>
             </div>
 
             <div class="endpoint">
@@ -90,69 +171,261 @@ async def root():
                 <p><strong>Request Body:</strong> <code>{"username": "your_geeksforgeeks_username"}</code></p>
             </div>
 
+            <div class="endpoint">
+                <h2>POST /profile</h2>
+                <p>Fetch several platforms concurrently. Returns a status per platform, with partial results if some fail or time out.</p>
+                <p><strong>Request Body:</strong> <code>{"leetcode": "...", "codeforces": "...", "codechef": "...", "geeksforgeeks": "...", "codingninjas": "..."}</code> (all optional)</p>
+            </div>
+
+            <div class="endpoint">
+                <h2>POST /cohort/leaderboard</h2>
+                <p>Rank a batch of up to 500 students. Streams NDJSON progress lines, then a ranked <code>leaderboard</code> line. Upstream calls are rate-limited per platform and cached profiles are reused.</p>
+                <p><strong>Request Body:</strong> <code>{"students": [{"name": "...", "leetcode": "...", "codeforces": "..."}]}</code></p>
+            </div>
+
+            <div class="endpoint">
+                <h2>POST /tracked</h2>
+                <p>Opt a profile in to background refreshes and progress history. <code>DELETE /tracked/{platform}/{username}</code> opts out.</p>
+                <p><strong>Request Body:</strong> <code>{"platform": "leetcode", "username": "..."}</code></p>
+            </div>
+
+            <div class="endpoint">
+                <h2>GET /tracked/{platform}/{username}?days=90</h2>
+                <p>Latest stats and the solved-count history (rating for CodeChef) of a tracked profile, served from local storage.</p>
+            </div>
+
             <p>Check <code>/docs</code> for detailed API documentation and interactive testing.</p>
         </body>
     </html>
     """
 
-@app.post("/leetcode")
-async def get_leetcode_stats(request: UsernameRequest):
-    username = request.username
-    url = "https://leetcode.com/graphql"
-    query = """
-    {
-        matchedUser(username: "%s") {
-            username
-            submitStatsGlobal {
-                acSubmissionNum {
-                    difficulty
-                    count
-                }
-            }
-            profile {
-                ranking
-                reputation
-            }
+LEETCODE_URL = "https://leetcode.com/graphql"
+LEETCODE_BATCH_SIZE = 20
+LEETCODE_BATCH_WINDOW = 0.02
+MAX_LEETCODE_BATCH_USERS = 100
+LEETCODE_USER_FRAGMENT = """
+fragment UserStats on User {
+    username
+    submitStatsGlobal {
+        acSubmissionNum {
+            difficulty
+            count
         }
     }
-    """ % username
-
-    response = requests.post(url, json={"query": query})
-    data = response.json()
-
-    if "data" in data and data["data"]["matchedUser"]:
-        user_data = data["data"]["matchedUser"]
-        stats = user_data["submitStatsGlobal"]["acSubmissionNum"]
-
-        result = {
-            "username": user_data["username"],
-            "ranking": user_data["profile"]["ranking"],
-            "reputation": user_data["profile"]["reputation"],
-            "total_solved": stats[0]["count"],
-            "easy_solved": stats[1]["count"],
-            "medium_solved": stats[2]["count"],
-            "hard_solved": stats[3]["count"]
-        }
-        return result
-    else:
-        raise HTTPException(status_code=404, detail="Failed to fetch LeetCode data")
+    profile {
+        ranking
+        reputation
+    }
+}
+"""
 
-@app.post("/codeforces")
-async def get_codeforces_stats(request: UsernameRequest):
-    handle = request.username
-    url = f"https://codeforces.com/api/user.status?handle={handle}&from=1"
-    response = requests.get(url)
+def build_leetcode_query(count: int) -> str:
+    # Usernames travel as GraphQL variables; only alias indexes go into the query text.
+    variables = ", ".join(f"$u{i}: String!" for i in range(count))
+    fields = "\n".join(f"    u{i}: matchedUser(username: $u{i}) {{ ...UserStats }}" for i in range(count))
+    return f"query ({variables}) {{\n{fields}\n}}\n{LEETCODE_USER_FRAGMENT}"
 
+def format_leetcode_user(user_data: Dict) -> Dict:
+    stats = user_data["submitStatsGlobal"]["acSubmissionNum"]
+    return {
+        "username": user_data["username"],
+        "ranking": user_data["profile"]["ranking"],
+        "reputation": user_data["profile"]["reputation"],
+        "total_solved": stats[0]["count"],
+        "easy_solved": stats[1]["count"],
+        "medium_solved": stats[2]["count"],
+        "hard_solved": stats[3]["count"]
+    }
+
+async def fetch_leetcode_batch(usernames: List[str]) -> Dict[str, Optional[Dict]]:
+    """Fetch up to LEETCODE_BATCH_SIZE users in one GraphQL request; unknown users map to None."""
+    variables = {f"u{i}": username for i, username in enumerate(usernames)}
+    response = await http_request(
+        "POST", LEETCODE_URL,
+        json={"query": build_leetcode_query(len(usernames)), "variables": variables}
+    )
     if response.status_code != 200:
+        raise HTTPException(status_code=502, detail=f"Failed to fetch LeetCode data. Status code: {response.status_code}")
+    data = response.json().get("data")
+    if data is None:
+        raise HTTPException(status_code=502, detail="Failed to fetch LeetCode data")
+
+    return {
+        username: format_leetcode_user(data[f"u{i}"]) if data.get(f"u{i}") else None
+        for i, username in enumerate(usernames)
+    }
+
+async def fetch_leetcode(username: str) -> Dict:
+    result = (await fetch_leetcode_batch([username]))[username]
+    if result is None:
+        raise HTTPException(status_code=404, detail="Failed to fetch LeetCode data")
+    return result
+
+# Upstream calls made for a waiting user go ahead of cohort and tracked-profile
+# jobs. Callers mark background work with fetch_priority.set(BACKGROUND_PRIORITY);
+# tasks created from there (cache refreshes, batches) inherit it.
+INTERACTIVE_PRIORITY = 0
+BACKGROUND_PRIORITY = 1
+fetch_priority: ContextVar[int] = ContextVar("fetch_priority", default=INTERACTIVE_PRIORITY)
+
+class LeetCodeBatcher:
+    """Coalesce concurrent single-user LeetCode lookups into batched GraphQL requests.
+
+    Lookups arriving within LEETCODE_BATCH_WINDOW seconds share one request
+    (up to LEETCODE_BATCH_SIZE users), and each request takes one slot of
+    the LeetCode platform scheduler at the most urgent priority in the batch.
+    """
+
+    def __init__(self):
+        self.pending: Dict[str, List[asyncio.Future]] = {}
+        self.pending_priority = BACKGROUND_PRIORITY
+        self.flush_task: Optional[asyncio.Task] = None
+        # The event loop only keeps weak references to tasks.
+        self.batch_tasks: set = set()
+
+    async def fetch(self, username: str) -> Dict:
+        future = asyncio.get_running_loop().create_future()
+        self.pending.setdefault(username, []).append(future)
+        self.pending_priority = min(self.pending_priority, fetch_priority.get())
+        if len(self.pending) >= LEETCODE_BATCH_SIZE:
+            self.flush()
+        elif self.flush_task is None:
+            self.flush_task = asyncio.create_task(self.flush_later())
+        return await future
+
+    async def flush_later(self):
+        await asyncio.sleep(LEETCODE_BATCH_WINDOW)
+        self.flush_task = None
+        self.flush()
+
+    def flush(self):
+        if self.flush_task is not None and self.flush_task is not asyncio.current_task():
+            self.flush_task.cancel()
+            self.flush_task = None
+        batch, self.pending = self.pending, {}
+        priority, self.pending_priority = self.pending_priority, BACKGROUND_PRIORITY
+        if batch:
+            task = asyncio.create_task(self.run(batch, priority))
+            self.batch_tasks.add(task)
+            task.add_done_callback(self.batch_tasks.discard)
+
+    async def run(self, batch: Dict[str, List[asyncio.Future]], priority: int):
+        try:
+            results = await platform_schedulers["leetcode"].run(fetch_leetcode_batch, list(batch), priority)
+        except Exception as e:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        for username, futures in batch.items():
+            for future in futures:
+                if future.done():
+                    continue
+                if results[username] is None:
+                    future.set_exception(HTTPException(status_code=404, detail="Failed to fetch LeetCode data"))
+                else:
+                    future.set_result(results[username])
+
+leetcode_batcher = LeetCodeBatcher()
+
+CODEFORCES_PAGE_SIZE = 50
+
+class CodeforcesSyncStore:
+    """Per-handle solved-problem sets and the highest submission id already seen."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.locks: Dict[str, asyncio.Lock] = {}
+
+    def open(self):
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS codeforces_sync (
+                    handle TEXT PRIMARY KEY,
+                    max_submission_id INTEGER NOT NULL,
+                    solved TEXT NOT NULL
+                )
+            """)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def read(self, handle: str) -> Tuple[int, set]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT max_submission_id, solved FROM codeforces_sync WHERE handle = ?", (handle,)
+            ).fetchone()
+        return (row[0], set(json.loads(row[1]))) if row else (0, set())
+
+    def write(self, handle: str, max_submission_id: int, solved: set):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO codeforces_sync (handle, max_submission_id, solved) VALUES (?, ?, ?)",
+                (handle, max_submission_id, json.dumps(sorted(solved)))
+            )
+
+    def lock(self, handle: str) -> asyncio.Lock:
+        if handle not in self.locks:
+            self.locks[handle] = asyncio.Lock()
+        return self.locks[handle]
+
+codeforces_sync_store = CodeforcesSyncStore(PROFILE_DB_PATH)
+
+async def fetch_codeforces_submissions(handle: str, start: int, count: Optional[int]) -> list:
+    url = "https://codeforces.com/api/user.status"
+    params = {"handle": handle, "from": start}
+    if count is not None:
+        params["count"] = count
+    response = await http_request("GET", url, params=params)
+
+    # Codeforces answers 400 for unknown handles.
+    if response.status_code == 400:
         raise HTTPException(status_code=404, detail="Failed to fetch Codeforces data")
+    if response.status_code != 200:
+        raise HTTPException(status_code=502, detail=f"Failed to fetch Codeforces data. Status code: {response.status_code}")
+    return response.json()["result"]
+
+async def fetch_codeforces(handle: str) -> Dict:
+    key = handle.strip().lower()
+    async with codeforces_sync_store.lock(key):
+        max_seen, solved_problems = await asyncio.to_thread(codeforces_sync_store.read, key)
+        newest = max_seen
 
-    data = response.json()
-    solved_problems = set()
+        if max_seen == 0:
+            # First sync downloads the full history once.
+            pages = [await fetch_codeforces_submissions(handle, 1, None)]
+        else:
+            # Submissions come newest first; page until we reach one already seen.
+            pages = []
+            start = 1
+            while True:
+                page = await fetch_codeforces_submissions(handle, start, CODEFORCES_PAGE_SIZE)
+                pages.append(page)
+                if len(page) < CODEFORCES_PAGE_SIZE or any(submission["id"] <= max_seen for submission in page):
+                    break
+                start += CODEFORCES_PAGE_SIZE
 
-    for submission in data['result']:
-        if submission['verdict'] == 'OK':
-            problem_id = f"{submission['problem']['contestId']}-{submission['problem']['index']}"
-            solved_problems.add(problem_id)
+        solved_before = len(solved_problems)
+        pending = []
+        for page in pages:
+            for submission in page:
+                if submission["id"] <= max_seen:
+                    continue
+                newest = max(newest, submission["id"])
+                if submission.get("verdict") in (None, "TESTING"):
+                    pending.append(submission["id"])
+                elif submission.get("verdict") == "OK":
+                    problem_id = f"{submission['problem'].get('contestId')}-{submission['problem']['index']}"
+                    solved_problems.add(problem_id)
+
+        # Submissions still being judged (e.g. during a live contest) have to
+        # be looked at again, so don't move the high-water mark past them.
+        if pending:
+            newest = max(max_seen, min(pending) - 1)
+
+        if newest != max_seen or len(solved_problems) != solved_before:
+            await asyncio.to_thread(codeforces_sync_store.write, key, newest, solved_problems)
 
     result = {
         "username": handle,
@@ -160,86 +433,799 @@ async def get_codeforces_stats(request: UsernameRequest):
     }
     return result
 
-@app.post("/codechef")
-async def get_codechef_stats(request: UsernameRequest):
-    username = request.username
-    url = f"https://www.codechef.com/users/{username}"
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+PARSE_CHUNK_SIZE = 32 * 1024
+
+def has_class(element, class_name: str) -> bool:
+    return class_name in (element.get("class") or "").split()
+
+def element_text(element) -> str:
+    return "".join(element.itertext()).strip()
+
+def parse_fields(html: str, extractors: Dict[str, Callable]) -> Dict[str, str]:
+    """Run extractors over elements of an incrementally parsed page.
+
+    The page is fed to lxml's C pull parser in chunks and parsing stops as
+    soon as every extractor has returned a value, so the rest of a large
+    profile page is never parsed.
+    """
+    parser = etree.HTMLPullParser(events=("end",))
+    found: Dict[str, str] = {}
+
+    def scan():
+        for _, element in parser.read_events():
+            if not isinstance(element.tag, str):
+                continue
+            for field, extract in extractors.items():
+                if field not in found:
+                    value = extract(element)
+                    if value is not None:
+                        found[field] = value
+
+    for start in range(0, len(html), PARSE_CHUNK_SIZE):
+        parser.feed(html[start:start + PARSE_CHUNK_SIZE])
+        scan()
+        if len(found) == len(extractors):
+            return found
+    try:
+        parser.close()
+    except etree.XMLSyntaxError:
+        pass
+    scan()
+    return found
+
+def extract_codechef_rating(element) -> Optional[str]:
+    if element.tag == "div" and has_class(element, "rating-number"):
+        return element_text(element)
+    return None
+
+def extract_codechef_highest_rating(element) -> Optional[str]:
+    if element.tag == "small":
+        text = element_text(element)
+        if "Highest Rating" in text:
+            return text.split()[-1].strip(")")
+    return None
+
+def extract_codechef_contests(element) -> Optional[str]:
+    if element.tag == "div" and has_class(element, "contest-participated-count"):
+        bold = element.find(".//b")
+        return element_text(bold) if bold is not None else "N/A"
+    return None
+
+def parse_codechef_profile(html: str) -> Dict[str, str]:
+    found = parse_fields(html, {
+        "rating": extract_codechef_rating,
+        "highest_rating": extract_codechef_highest_rating,
+        "contests_attended": extract_codechef_contests,
+    })
+    return {
+        "rating": found.get("rating", "N/A"),
+        "highest_rating": found.get("highest_rating", "N/A"),
+        "contests_attended": found.get("contests_attended", "N/A")
+    }
+
+def extract_class_text(class_name: str) -> Callable:
+    def extract(element) -> Optional[str]:
+        if element.tag == "div" and has_class(element, class_name):
+            return element_text(element)
+        return None
+    return extract
+
+def extract_geeksforgeeks_solved(element) -> Optional[str]:
+    if element.tag == "div" and has_class(element, "scoreCard_head_left--score__oSi_x"):
+        # The score cards are Coding Score, Problem Solved and Contest Rating;
+        # take the one labelled as problems solved.
+        label = element.getprevious()
+        if label is None or "Problem" in element_text(label):
+            return element_text(element)
+    return None
+
+def parse_geeksforgeeks_profile(html: str) -> Dict[str, str]:
+    found = parse_fields(html, {
+        "problems_solved": extract_geeksforgeeks_solved,
+        "college_name": extract_class_text("educationDetails_head_left--text__tgi9I"),
+    })
+    return {
+        "problems_solved": found.get("problems_solved", "N/A"),
+        "college_name": found.get("college_name", "N/A")
     }
 
-    response = requests.get(url, headers=headers)
+async def fetch_codechef(username: str) -> Dict:
+    url = f"https://www.codechef.com/users/{username}"
+    response = await http_request("GET", url, headers=BROWSER_HEADERS)
     if response.status_code != 200:
-        raise HTTPException(status_code=404, detail=f"Failed to fetch CodeChef data. Status code: {response.status_code}")
+        raise HTTPException(status_code=404 if response.status_code == 404 else 502, detail=f"Failed to fetch CodeChef data. Status code: {response.status_code}")
+
+    result = {"username": username}
+    result.update(parse_codechef_profile(response.text))
+    return result
+
+CODINGNINJAS_PROFILE_URL = "https://www.naukri.com/code360/profile/{username}"
+CODINGNINJAS_SOLVED_SELECTOR = ".left.zen-typo-heading-5"
+
+class BrowserPool:
+    """A few long-lived headless Chrome instances leased one request at a time.
+
+    Drivers start lazily, are recycled after max_uses page loads or when they
+    crash, and all Selenium calls run in worker threads off the event loop.
+    """
+
+    def __init__(self, size: int, max_uses: int, wait_timeout: float):
+        self.max_uses = max_uses
+        self.wait_timeout = wait_timeout
+        self.slots: asyncio.Queue = asyncio.Queue()
+        for _ in range(size):
+            self.slots.put_nowait({"driver": None, "uses": 0})
+
+    def _new_driver(self):
+        options = webdriver.ChromeOptions()
+        options.add_argument("--headless=new")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-gpu")
+        options.page_load_strategy = "eager"
+        driver = webdriver.Chrome(options=options)
+        # WebDriverWait only starts once get() returns; without this a hung
+        # page holds the slot for Selenium's 300 s default.
+        driver.set_page_load_timeout(self.wait_timeout)
+        return driver
+
+    def _scrape_text(self, slot: Dict, url: str, selector: str) -> str:
+        if slot["driver"] is None:
+            slot["driver"] = self._new_driver()
+            slot["uses"] = 0
+        driver = slot["driver"]
+        slot["uses"] += 1
+        driver.get(url)
+        element = WebDriverWait(driver, self.wait_timeout).until(
+            EC.visibility_of_element_located((By.CSS_SELECTOR, selector))
+        )
+        return element.text
+
+    def _retire(self, slot: Dict):
+        if slot["driver"] is not None:
+            try:
+                slot["driver"].quit()
+            except Exception:
+                pass
+        slot["driver"] = None
+        slot["uses"] = 0
+
+    async def scrape_text(self, url: str, selector: str) -> str:
+        slot = await self.slots.get()
+        try:
+            return await asyncio.to_thread(self._scrape_text, slot, url, selector)
+        except TimeoutException:
+            # The page or the element timed out; the browser itself is fine.
+            raise
+        except WebDriverException:
+            await asyncio.to_thread(self._retire, slot)
+            raise
+        finally:
+            if slot["uses"] >= self.max_uses:
+                await asyncio.to_thread(self._retire, slot)
+            self.slots.put_nowait(slot)
+
+    async def close(self):
+        while not self.slots.empty():
+            await asyncio.to_thread(self._retire, self.slots.get_nowait())
 
-    soup = BeautifulSoup(response.text, "html.parser")
+browser_pool = BrowserPool(
+    size=int(os.getenv("BROWSER_POOL_SIZE", 2)),
+    max_uses=int(os.getenv("BROWSER_MAX_USES", 50)),
+    wait_timeout=10.0
+)
 
-    rating_tag = soup.find("div", class_="rating-number")
-    highest_rating_tag = soup.find("small", string=lambda text: "Highest Rating" in text if text else False)
-    rank_section = soup.find("ul", class_="rating-ranks")
-    contest_section = soup.find("div", class_="contest-participated-count")
+@app.on_event("shutdown")
+async def close_browser_pool():
+    await browser_pool.close()
 
-    rating = rating_tag.text.strip() if rating_tag else "N/A"
-    highest_rating = highest_rating_tag.text.split()[-1].strip(")") if highest_rating_tag else "N/A"
-    contests_attended = contest_section.find("b").text.strip() if contest_section and contest_section.find("b") else "N/A"
+async def fetch_codingninjas(username: str) -> Dict:
+    url = CODINGNINJAS_PROFILE_URL.format(username=quote(username, safe=""))
+    try:
+        solved_count = await browser_pool.scrape_text(url, CODINGNINJAS_SOLVED_SELECTOR)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Could not fetch Coding Ninjas data. Error: {str(e)}")
 
     result = {
         "username": username,
-        "rating": rating,
-        "highest_rating": highest_rating,
-        "contests_attended": contests_attended
+        "questions_solved": solved_count
     }
     return result
 
+async def fetch_geeksforgeeks(username: str) -> Dict:
+    url = f"https://www.geeksforgeeks.org/user/{username}/"
+    response = await http_request("GET", url, headers=BROWSER_HEADERS)
+    if response.status_code != 200:
+        raise HTTPException(status_code=404 if response.status_code == 404 else 502, detail=f"Failed to fetch GeeksforGeeks data. Status code: {response.status_code}")
+
+    result = {"username": username}
+    result.update(parse_geeksforgeeks_profile(response.text))
+    return result
+
+PLATFORM_FETCHERS = {
+    "leetcode": fetch_leetcode,
+    "codeforces": fetch_codeforces,
+    "codechef": fetch_codechef,
+    "geeksforgeeks": fetch_geeksforgeeks,
+    "codingninjas": fetch_codingninjas,
+}
+PLATFORM_TIMEOUT = 15.0
+
+# Fresh-for windows in seconds. Stats change a few times a day at most.
+PLATFORM_TTLS = {
+    "leetcode": 30 * 60,
+    "codeforces": 30 * 60,
+    "codechef": 2 * 3600,
+    "geeksforgeeks": 2 * 3600,
+    "codingninjas": 6 * 3600,
+}
+NEGATIVE_TTL = 10 * 60
+STALE_WINDOW = 24 * 3600
+MEMORY_CACHE_SIZE = 10000
+CACHE_PURGE_INTERVAL = 3600
+
+def log_refresh_error(task: asyncio.Task):
+    if not task.cancelled() and task.exception() is not None:
+        print(f"Error refreshing cached profile: {task.exception()}")
+
+class TokenBucket:
+    """Allows `rate` acquisitions per second on average with bursts up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+class PlatformScheduler:
+    """Rate limit and bound concurrency for every upstream call to one platform.
+
+    Free slots go to the waiter with the lowest priority value, first come
+    first served within a priority.
+    """
+
+    def __init__(self, rate: float, burst: float, concurrency: int):
+        self.bucket = TokenBucket(rate, burst)
+        self.slots = concurrency
+        self.waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self.arrivals = itertools.count()
+
+    async def acquire(self, priority: int):
+        if self.slots and not self.waiters:
+            self.slots -= 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self.waiters, (priority, next(self.arrivals), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Pass on a slot that was handed over just as we were cancelled.
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self):
+        while self.waiters:
+            _, _, future = heapq.heappop(self.waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self.slots += 1
+
+    async def run(self, fetcher: Callable, username: str, priority: Optional[int] = None) -> Dict:
+        await self.acquire(fetch_priority.get() if priority is None else priority)
+        try:
+            await self.bucket.acquire()
+            return await fetcher(username)
+        finally:
+            self.release()
+
+# Upstream budgets per platform: requests per second, burst size, concurrent requests.
+PLATFORM_LIMITS = {
+    "leetcode": (2.0, 5, 4),
+    "codeforces": (0.5, 1, 1),
+    "codechef": (1.0, 3, 2),
+    "geeksforgeeks": (1.0, 3, 2),
+    "codingninjas": (0.5, 1, int(os.getenv("BROWSER_POOL_SIZE", 2))),
+}
+platform_schedulers = {
+    platform: PlatformScheduler(rate, burst, concurrency)
+    for platform, (rate, burst, concurrency) in PLATFORM_LIMITS.items()
+}
+
+async def fetch_upstream(platform: str, username: str) -> Dict:
+    if platform == "leetcode":
+        # The batcher schedules each batched request itself.
+        return await leetcode_batcher.fetch(username)
+    return await platform_schedulers[platform].run(PLATFORM_FETCHERS[platform], username)
+
+class ProfileCache:
+    """Two-tier (memory LRU + sqlite) cache of platform stats keyed by (platform, username).
+
+    Fresh entries are served directly. Entries past their TTL but inside
+    STALE_WINDOW are served immediately while one background refresh runs.
+    Unknown users (upstream 404) are cached for NEGATIVE_TTL.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.memory: "OrderedDict[Tuple[str, str], Dict]" = OrderedDict()
+        self.inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+
+    def open(self):
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS profile_cache (
+                    platform TEXT NOT NULL,
+                    username TEXT NOT NULL,
+                    entry TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    PRIMARY KEY (platform, username)
+                )
+            """)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _read(self, key: Tuple[str, str]) -> Optional[Dict]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT entry FROM profile_cache WHERE platform = ? AND username = ?", key
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _write(self, key: Tuple[str, str], entry: Dict):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO profile_cache (platform, username, entry, fetched_at) VALUES (?, ?, ?, ?)",
+                (*key, json.dumps(entry), entry["fetched_at"])
+            )
+
+    def purge_expired(self) -> int:
+        """Delete rows get() would no longer serve: negative entries past NEGATIVE_TTL
+        and profiles past their TTL plus STALE_WINDOW."""
+        now = time.time()
+        with self._connect() as conn:
+            purged = conn.execute(
+                "DELETE FROM profile_cache WHERE json_extract(entry, '$.ok') = 0 AND fetched_at < ?",
+                (now - NEGATIVE_TTL,)
+            ).rowcount
+            for platform, ttl in PLATFORM_TTLS.items():
+                purged += conn.execute(
+                    "DELETE FROM profile_cache WHERE platform = ? AND fetched_at < ?",
+                    (platform, now - ttl - STALE_WINDOW)
+                ).rowcount
+        return purged
+
+    def _remember(self, key: Tuple[str, str], entry: Dict):
+        self.memory[key] = entry
+        self.memory.move_to_end(key)
+        if len(self.memory) > MEMORY_CACHE_SIZE:
+            self.memory.popitem(last=False)
+
+    def key(self, platform: str, username: str) -> Tuple[str, str]:
+        return platform, username.strip().lower()
+
+    async def lookup(self, key: Tuple[str, str]) -> Optional[Dict]:
+        entry = self.memory.get(key)
+        if entry is not None:
+            self.memory.move_to_end(key)
+        else:
+            entry = await asyncio.to_thread(self._read, key)
+            if entry is not None:
+                self._remember(key, entry)
+        return entry
+
+    async def store(self, key: Tuple[str, str], entry: Dict):
+        self._remember(key, entry)
+        await asyncio.to_thread(self._write, key, entry)
+
+    async def _fetch_and_store(self, platform: str, username: str, key: Tuple[str, str]) -> Dict:
+        try:
+            try:
+                data = await fetch_upstream(platform, username)
+                entry = {"ok": True, "data": data, "fetched_at": time.time()}
+            except HTTPException as e:
+                if e.status_code != 404:
+                    raise
+                entry = {"ok": False, "status_code": 404, "detail": e.detail, "fetched_at": time.time()}
+            await self.store(key, entry)
+            return entry
+        finally:
+            self.inflight.pop(key, None)
+
+    def _refresh(self, platform: str, username: str, key: Tuple[str, str]) -> asyncio.Task:
+        # Single-flight: concurrent misses for one profile share one upstream fetch.
+        if key not in self.inflight:
+            self.inflight[key] = asyncio.create_task(self._fetch_and_store(platform, username, key))
+        return self.inflight[key]
+
+    def _refresh_in_background(self, platform: str, username: str, key: Tuple[str, str]):
+        task = self._refresh(platform, username, key)
+        task.add_done_callback(log_refresh_error)
+
+    async def refresh(self, platform: str, username: str) -> Dict:
+        """Fetch upstream now, regardless of freshness, and return the cache entry."""
+        key = self.key(platform, username)
+        return await asyncio.shield(self._refresh(platform, username, key))
+
+    def ttl(self, platform: str, entry: Dict) -> float:
+        return PLATFORM_TTLS[platform] if entry["ok"] else NEGATIVE_TTL
+
+    async def get(self, platform: str, username: str) -> Dict:
+        key = self.key(platform, username)
+        entry = await self.lookup(key)
+        if entry is not None:
+            age = time.time() - entry["fetched_at"]
+            ttl = self.ttl(platform, entry)
+            if age >= ttl and entry["ok"] and age < ttl + STALE_WINDOW:
+                self._refresh_in_background(platform, username, key)
+            elif age >= ttl:
+                entry = None
+
+        if entry is None:
+            entry = await asyncio.shield(self._refresh(platform, username, key))
+
+        if not entry["ok"]:
+            raise HTTPException(status_code=entry["status_code"], detail=entry["detail"])
+        return entry["data"]
+
+profile_cache = ProfileCache(PROFILE_DB_PATH)
+
+async def purge_expired_profiles():
+    while True:
+        try:
+            await asyncio.to_thread(profile_cache.purge_expired)
+        except Exception as e:
+            print(f"Error purging expired cached profiles: {str(e)}")
+        await asyncio.sleep(CACHE_PURGE_INTERVAL)
+
+@app.on_event("startup")
+async def start_cache_purger():
+    app.state.cache_purger = asyncio.create_task(purge_expired_profiles())
+
+@app.on_event("shutdown")
+async def stop_cache_purger():
+    app.state.cache_purger.cancel()
+
+async def get_platform_stats(platform: str, username: str) -> Dict:
+    try:
+        # The upstream fetch is shielded, so a timed-out fetch still fills the cache.
+        return await asyncio.wait_for(profile_cache.get(platform, username), timeout=PLATFORM_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail=f"No response from {platform} within {PLATFORM_TIMEOUT:.0f}s")
+
+@app.post("/leetcode")
+async def get_leetcode_stats(request: UsernameRequest):
+    return await get_platform_stats("leetcode", request.username)
+
+@app.post("/leetcode/batch")
+async def get_leetcode_batch_stats(request: UsernamesRequest):
+    usernames = list(dict.fromkeys(request.usernames))
+    if len(usernames) > MAX_LEETCODE_BATCH_USERS:
+        raise HTTPException(status_code=400, detail=f"A batch can have at most {MAX_LEETCODE_BATCH_USERS} usernames")
+    results = await asyncio.gather(
+        *(fetch_platform("leetcode", username) for username in usernames)
+    )
+    return {"users": dict(zip(usernames, results))}
+
+@app.post("/codeforces")
+async def get_codeforces_stats(request: UsernameRequest):
+    return await get_platform_stats("codeforces", request.username)
+
+@app.post("/codechef")
+async def get_codechef_stats(request: UsernameRequest):
+    return await get_platform_stats("codechef", request.username)
+
 @app.post("/codingninjas")
 async def get_codingninjas_stats(request: UsernameRequest):
-    hardcoded_url = "https://www.naukri.com/code360/profile/268238b8-bc4b-402f-bbed-8421ed253193"
-    
-    driver = webdriver.Chrome()  
-    driver.get(hardcoded_url)
+    return await get_platform_stats("codingninjas", request.username)
+
+@app.post("/geeksforgeeks")
+async def get_geeksforgeeks_stats(request: UsernameRequest):
+    return await get_platform_stats("geeksforgeeks", request.username)
 
-    time.sleep(5)
+def profile_handles(request: ProfileRequest) -> Dict[str, str]:
+    return {platform: getattr(request, platform) for platform in PLATFORM_FETCHERS if getattr(request, platform)}
 
+async def fetch_platform(platform: str, username: str, timeout: Optional[float] = PLATFORM_TIMEOUT) -> Dict:
     try:
-        solved_element = driver.find_element(By.CLASS_NAME, "left.zen-typo-heading-5")
-        solved_count = solved_element.text
-        result = {
-            "username": request.username,  
-            "questions_solved": solved_count
+        data = await asyncio.wait_for(
+            profile_cache.get(platform, username),
+            timeout=timeout
+        )
+        return {"status": "ok", "data": data}
+    except asyncio.TimeoutError:
+        return {"status": "timeout", "detail": f"No response within {timeout:.0f}s"}
+    except HTTPException as e:
+        return {"status": "error", "detail": e.detail}
+    except Exception as e:
+        return {"status": "error", "detail": str(e)}
+
+@app.post("/profile")
+async def get_profile(request: ProfileRequest):
+    handles = profile_handles(request)
+    if not handles:
+        raise HTTPException(status_code=400, detail="Provide at least one platform username")
+
+    results = await asyncio.gather(
+        *(fetch_platform(platform, username) for platform, username in handles.items())
+    )
+    return {"platforms": dict(zip(handles, results))}
+
+MAX_COHORT_SIZE = 500
+
+# Fields that count towards a student's solved total, per platform.
+SOLVED_FIELDS = {
+    "leetcode": "total_solved",
+    "codeforces": "solved_problems",
+    "geeksforgeeks": "problems_solved",
+    "codingninjas": "questions_solved",
+}
+
+def parse_count(value) -> int:
+    try:
+        return int(str(value).replace(",", "").strip())
+    except ValueError:
+        return 0
+
+def rank_cohort(students: List[CohortStudent], rows: List[Dict]) -> List[Dict]:
+    table = []
+    for student, platforms in zip(students, rows):
+        solved = {
+            platform: parse_count(result["data"][field])
+            for platform, field in SOLVED_FIELDS.items()
+            if platforms.get(platform, {}).get("status") == "ok"
         }
+        codechef = platforms.get("codechef", {})
+        table.append({
+            "name": student.name,
+            "total_solved": sum(solved.values()),
+            "solved": solved,
+            "codechef_rating": codechef["data"]["rating"] if codechef.get("status") == "ok" else None,
+            "errors": {platform: result["detail"] for platform, result in platforms.items() if result["status"] != "ok"},
+        })
+    table.sort(key=lambda row: (-row["total_solved"], row["name"].lower()))
+    for rank, row in enumerate(table, start=1):
+        row["rank"] = rank
+    return table
+
+@app.post("/cohort/leaderboard")
+async def cohort_leaderboard(request: CohortRequest):
+    if len(request.students) > MAX_COHORT_SIZE:
+        raise HTTPException(status_code=400, detail=f"A cohort can have at most {MAX_COHORT_SIZE} students")
+
+    jobs = [
+        (index, platform, username)
+        for index, student in enumerate(request.students)
+        for platform, username in profile_handles(student).items()
+    ]
+
+    async def run_job(index: int, platform: str, username: str) -> Tuple[int, str, Dict]:
+        # No per-call deadline: jobs wait their turn in the platform scheduler,
+        # behind interactive lookups.
+        fetch_priority.set(BACKGROUND_PRIORITY)
+        return index, platform, await fetch_platform(platform, username, timeout=None)
+
+    async def event_stream():
+        yield json.dumps({"type": "start", "students": len(request.students), "jobs": len(jobs)}) + "\n"
+        rows: List[Dict] = [{} for _ in request.students]
+        tasks = [asyncio.create_task(run_job(*job)) for job in jobs]
+        try:
+            for done, task in enumerate(asyncio.as_completed(tasks), start=1):
+                index, platform, result = await task
+                rows[index][platform] = result
+                yield json.dumps({
+                    "type": "progress", "done": done, "total": len(jobs),
+                    "name": request.students[index].name, "platform": platform, "status": result["status"]
+                }) + "\n"
+        finally:
+            for task in tasks:
+                task.cancel()
+        yield json.dumps({"type": "leaderboard", "rows": rank_cohort(request.students, rows)}) + "\n"
+
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
+
+TRACK_REFRESH_INTERVAL = 6 * 3600
+TRACK_REFRESH_JITTER = 0.2
+TRACK_TICK_SECONDS = 60
+TRACK_BATCH_SIZE = 50
+# A claimed profile is skipped by other workers for this long; reschedule()
+# replaces the lease once the refresh finishes.
+TRACK_CLAIM_SECONDS = 600
+
+def snapshot_value(platform: str, data: Dict) -> int:
+    if platform == "codechef":
+        return parse_count(data["rating"])
+    return parse_count(data[SOLVED_FIELDS[platform]])
+
+class TrackedProfileStore:
+    """Opt-in tracked profiles and their compact (taken_at, value) time series."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def open(self):
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS tracked_profiles (
+                    platform TEXT NOT NULL,
+                    username TEXT NOT NULL,
+                    added_at REAL NOT NULL,
+                    next_refresh_at REAL NOT NULL,
+                    PRIMARY KEY (platform, username)
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS profile_snapshots (
+                    platform TEXT NOT NULL,
+                    username TEXT NOT NULL,
+                    taken_at INTEGER NOT NULL,
+                    value INTEGER NOT NULL,
+                    PRIMARY KEY (platform, username, taken_at)
+                ) WITHOUT ROWID
+            """)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def track(self, platform: str, username: str):
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO tracked_profiles (platform, username, added_at, next_refresh_at) VALUES (?, ?, ?, ?)",
+                (platform, username, now, now)
+            )
+
+    def untrack(self, platform: str, username: str) -> bool:
+        with self._connect() as conn:
+            deleted = conn.execute(
+                "DELETE FROM tracked_profiles WHERE platform = ? AND username = ?", (platform, username)
+            ).rowcount
+        return deleted > 0
+
+    def claim_due(self, limit: int) -> List[Tuple[str, str]]:
+        """Select due profiles and push their next_refresh_at out in one write
+        transaction, so each uvicorn worker's refresher gets a disjoint batch."""
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            due = conn.execute(
+                "SELECT platform, username FROM tracked_profiles WHERE next_refresh_at <= ? ORDER BY next_refresh_at LIMIT ?",
+                (now, limit)
+            ).fetchall()
+            conn.executemany(
+                "UPDATE tracked_profiles SET next_refresh_at = ? WHERE platform = ? AND username = ?",
+                [(now + TRACK_CLAIM_SECONDS, platform, username) for platform, username in due]
+            )
+            conn.commit()
+            return due
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def reschedule(self, platform: str, username: str):
+        # Jitter spreads refreshes over the day instead of bunching them up.
+        delay = TRACK_REFRESH_INTERVAL * random.uniform(1 - TRACK_REFRESH_JITTER, 1 + TRACK_REFRESH_JITTER)
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE tracked_profiles SET next_refresh_at = ? WHERE platform = ? AND username = ?",
+                (time.time() + delay, platform, username)
+            )
+
+    def append_snapshot(self, platform: str, username: str, value: int):
+        with self._connect() as conn:
+            last = conn.execute(
+                "SELECT value FROM profile_snapshots WHERE platform = ? AND username = ? ORDER BY taken_at DESC LIMIT 1",
+                (platform, username)
+            ).fetchone()
+            # Only changes are stored; an unchanged value is implied until the next point.
+            if last is None or last[0] != value:
+                conn.execute(
+                    "INSERT OR REPLACE INTO profile_snapshots (platform, username, taken_at, value) VALUES (?, ?, ?, ?)",
+                    (platform, username, int(time.time()), value)
+                )
+
+    def history(self, platform: str, username: str, since: float) -> Optional[List[Dict]]:
+        with self._connect() as conn:
+            tracked = conn.execute(
+                "SELECT 1 FROM tracked_profiles WHERE platform = ? AND username = ?", (platform, username)
+            ).fetchone()
+            if not tracked:
+                return None
+            rows = conn.execute(
+                "SELECT taken_at, value FROM profile_snapshots WHERE platform = ? AND username = ? AND taken_at >= ? ORDER BY taken_at",
+                (platform, username, int(since))
+            ).fetchall()
+            # Only changes are stored, so the value at the start of the window
+            # is the last point before it.
+            before = conn.execute(
+                "SELECT value FROM profile_snapshots WHERE platform = ? AND username = ? AND taken_at < ? ORDER BY taken_at DESC LIMIT 1",
+                (platform, username, int(since))
+            ).fetchone()
+        history = [{"taken_at": taken_at, "value": value} for taken_at, value in rows]
+        if before is not None:
+            history.insert(0, {"taken_at": int(since), "value": before[0]})
+        return history
+
+tracked_store = TrackedProfileStore(PROFILE_DB_PATH)
+
+async def refresh_tracked_profile(platform: str, username: str):
+    fetch_priority.set(BACKGROUND_PRIORITY)
+    try:
+        entry = await profile_cache.refresh(platform, username)
+        if entry["ok"]:
+            await asyncio.to_thread(tracked_store.append_snapshot, platform, username, snapshot_value(platform, entry["data"]))
     except Exception as e:
-        driver.quit()
-        raise HTTPException(status_code=500, detail=f"Could not fetch Coding Ninjas data. Error: {str(e)}")
-    
-    driver.quit()
-    return result
+        print(f"Error refreshing tracked {platform} profile {username!r}: {str(e)}")
+    finally:
+        await asyncio.to_thread(tracked_store.reschedule, platform, username)
 
-@app.post("/geeksforgeeks")
-async def get_geeksforgeeks_stats(request: UsernameRequest):
-    username = request.username
-    url = f"https://www.geeksforgeeks.org/user/{username}/"
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-    }
+async def run_tracked_refresher():
+    while True:
+        try:
+            due = await asyncio.to_thread(tracked_store.claim_due, TRACK_BATCH_SIZE)
+            # Platform schedulers bound the upstream rate of this fan-out.
+            await asyncio.gather(*(refresh_tracked_profile(platform, username) for platform, username in due))
+        except Exception as e:
+            print(f"Error in tracked profile refresher: {str(e)}")
+        await asyncio.sleep(TRACK_TICK_SECONDS)
 
-    response = requests.get(url, headers=headers)
-    if response.status_code != 200:
-        raise HTTPException(status_code=404, detail=f"Failed to fetch GeeksforGeeks data. Status code: {response.status_code}")
+@app.on_event("startup")
+async def start_tracked_refresher():
+    app.state.tracked_refresher = asyncio.create_task(run_tracked_refresher())
 
-    soup = BeautifulSoup(response.text, "html.parser")
+@app.on_event("shutdown")
+async def stop_tracked_refresher():
+    app.state.tracked_refresher.cancel()
 
-    score_element = soup.find("div", class_="scoreCard_head_left--score__oSi_x")
-    problems_solved = score_element.text.strip() if score_element else "N/A"
+def tracked_key(platform: str, username: str) -> Tuple[str, str]:
+    if platform not in PLATFORM_FETCHERS:
+        raise HTTPException(status_code=400, detail=f"Unknown platform: {platform}")
+    return profile_cache.key(platform, username)
 
-    college_element = soup.find("div", class_="educationDetails_head_left--text__tgi9I")
-    college_name = college_element.text.strip() if college_element else "N/A"
+@app.post("/tracked")
+async def track_profile(request: TrackRequest):
+    platform, username = tracked_key(request.platform, request.username)
+    await asyncio.to_thread(tracked_store.track, platform, username)
+    return {"platform": platform, "username": username, "tracked": True}
 
-    result = {
+@app.delete("/tracked/{platform}/{username}")
+async def untrack_profile(platform: str, username: str):
+    platform, username = tracked_key(platform, username)
+    if not await asyncio.to_thread(tracked_store.untrack, platform, username):
+        raise HTTPException(status_code=404, detail="Profile is not tracked")
+    return {"platform": platform, "username": username, "tracked": False}
+
+@app.get("/tracked/{platform}/{username}")
+async def get_tracked_profile(platform: str, username: str, days: int = 90):
+    platform, username = tracked_key(platform, username)
+    history = await asyncio.to_thread(tracked_store.history, platform, username, time.time() - days * 86400)
+    if history is None:
+        raise HTTPException(status_code=404, detail="Profile is not tracked")
+    cached = await profile_cache.lookup((platform, username))
+    return {
+        "platform": platform,
         "username": username,
-        "problems_solved": problems_solved,
-        "college_name": college_name
+        "latest": cached["data"] if cached and cached["ok"] else None,
+        "history": history
     }
-    return result
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 8000))
@@ -0,0 +1,89 @@
+"""Build the compact PYQ corpus (gate_pyq.jsonl.gz) that main.py loads.
+
+Sources are JSON lines files, one question per line:
+    {"year": 2021, "subject": "...", "topic": "...", "keywords": [...],
+     "difficulty": "Medium", "mcq": "...", "options": {"a": ..., "d": ...},
+     "correct": "a"}
+"year" and "difficulty" are optional. Only add a year for questions
+transcribed from a real GATE paper; it is shown to students as
+"[GATE <year>]". pyq/seed.jsonl ships syllabus questions without years.
+
+    python build_pyq_corpus.py                      # pyq/*.jsonl -> gate_pyq.jsonl.gz
+    python build_pyq_corpus.py extra.jsonl -o out.jsonl.gz
+
+Entries are validated, de-duplicated by question text and sorted, and the
+gzip header carries no timestamp, so rebuilding the same sources gives the
+same bytes.
+"""
+import argparse
+import glob
+import gzip
+import json
+import os
+import re
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+OPTION_KEYS = ["a", "b", "c", "d"]
+FIELDS = ["year", "subject", "topic", "keywords", "difficulty", "mcq", "options", "correct"]
+
+def normalize_text(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", " ", text.lower()).strip()
+
+def check_entry(entry: dict) -> str:
+    """Return a description of the first problem with entry, or "" if it is usable."""
+    for field in ["subject", "topic", "mcq", "options", "correct"]:
+        if not entry.get(field):
+            return f"missing {field}"
+    options = entry["options"]
+    if not isinstance(options, dict) or sorted(options) != OPTION_KEYS:
+        return "options must have exactly the keys a, b, c and d"
+    if any(not str(value).strip() for value in options.values()):
+        return "empty option"
+    if entry["correct"] not in OPTION_KEYS:
+        return "correct must be one of a, b, c or d"
+    if not isinstance(entry.get("keywords", []), list):
+        return "keywords must be a list"
+    if "year" in entry and not isinstance(entry["year"], int):
+        return "year must be an integer"
+    if entry.get("difficulty") and entry["difficulty"] not in ["Easy", "Medium", "Hard"]:
+        return "difficulty must be Easy, Medium or Hard"
+    return ""
+
+def load_sources(paths: list) -> list:
+    entries = {}
+    problems = 0
+    for path in paths:
+        with open(path, encoding="utf-8") as source:
+            for line_number, line in enumerate(source, start=1):
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                problem = check_entry(entry)
+                if problem:
+                    print(f"{path}:{line_number}: {problem}", file=sys.stderr)
+                    problems += 1
+                    continue
+                entries.setdefault(normalize_text(entry["mcq"]), {field: entry[field] for field in FIELDS if field in entry})
+    if problems:
+        sys.exit(f"{problems} invalid entries, corpus not written")
+    return sorted(entries.values(), key=lambda entry: (entry["subject"], entry["topic"], -entry.get("year", 0), entry["mcq"]))
+
+def write_corpus(entries: list, output: str):
+    with open(output, "wb") as raw:
+        with gzip.GzipFile(filename="", mode="wb", fileobj=raw, mtime=0) as compressed:
+            for entry in entries:
+                compressed.write((json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8"))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the GATE PYQ corpus used by the quiz API.")
+    parser.add_argument("sources", nargs="*", help="JSON lines files (default: pyq/*.jsonl)")
+    parser.add_argument("-o", "--output", default=os.path.join(HERE, "gate_pyq.jsonl.gz"))
+    args = parser.parse_args()
+
+    sources = args.sources or sorted(glob.glob(os.path.join(HERE, "pyq", "*.jsonl")))
+    if not sources:
+        sys.exit("no source files found")
+    entries = load_sources(sources)
+    write_corpus(entries, args.output)
+    print(f"wrote {len(entries)} questions from {len(sources)} file(s) to {args.output}")
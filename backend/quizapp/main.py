@@ -1,13 +1,18 @@
 from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List, Dict
+from typing import List, Dict, Tuple, AsyncIterator, Optional
 from dotenv import load_dotenv
 from langchain_core.prompts import PromptTemplate
 from langchain_groq import ChatGroq
 from langchain_core.output_parsers import JsonOutputParser
 import os
-from fastapi.responses import HTMLResponse
+import re
+import random
+import asyncio
+import json
+import gzip
+from fastapi.responses import HTMLResponse, StreamingResponse
 
 load_dotenv()
 
@@ -29,9 +34,11 @@ llm = ChatGroq(
     groq_api_key=GROQ_API_KEY
 )
 
+MAX_QUIZ_QUESTIONS = 50
+
 class QuizRequest(BaseModel):
     text_content: str
-    num_questions: int = 5
+    num_questions: int = Field(5, ge=1, le=MAX_QUIZ_QUESTIONS)
     quiz_level: str = "Medium"
 
 class QuizOption(BaseModel):
@@ -47,8 +54,272 @@ class QuizQuestion(BaseModel):
 
 class QuizResponse(BaseModel):
     mcqs: List[QuizQuestion]
+    stats: Optional[Dict[str, int]] = None
+
+OPTION_KEYS = ["a", "b", "c", "d"]
+
+def new_stats() -> Dict[str, int]:
+    return {"valid": 0, "repaired": 0, "invalid": 0, "regenerated": 0}
+
+def validate_question(item) -> Tuple[Optional[Dict], str]:
+    """Check one generated MCQ, fixing common formatting slips.
+
+    Returns (question, status) where status is "valid", "repaired" or
+    "invalid"; invalid items are returned as None.
+    """
+    if not isinstance(item, dict):
+        return None, "invalid"
+    repaired = False
+    mcq = str(item.get("mcq", "")).strip()
+
+    options = item.get("options")
+    if isinstance(options, list) and len(options) == len(OPTION_KEYS):
+        options = dict(zip(OPTION_KEYS, options))
+        repaired = True
+    if not isinstance(options, dict):
+        return None, "invalid"
+    normalized_options = {str(key).strip().lower().strip("()."): value for key, value in options.items()}
+    if list(normalized_options) != list(options):
+        repaired = True
+    if not mcq or any(not str(normalized_options.get(key, "")).strip() for key in OPTION_KEYS):
+        return None, "invalid"
+    normalized_options = {key: str(normalized_options[key]).strip() for key in OPTION_KEYS}
+
+    correct = str(item.get("correct", "")).strip()
+    if correct not in OPTION_KEYS:
+        # Match the option text first: "D flip-flop" is an answer, not option d.
+        by_text = [key for key, value in normalized_options.items() if normalize_text(value) == normalize_text(correct)]
+        letter = re.fullmatch(r"(?:option\s*)?\(?([a-d])\)?[.:]?", correct, flags=re.IGNORECASE)
+        # "b) D flip-flop" only counts when the text agrees with option b.
+        labelled = re.fullmatch(r"(?:option\s*)?\(?([a-d])[).:]\s*(.+)", correct, flags=re.IGNORECASE | re.DOTALL)
+        if len(by_text) == 1:
+            correct = by_text[0]
+        elif letter:
+            correct = letter.group(1).lower()
+        elif labelled and normalize_text(labelled.group(2)) == normalize_text(normalized_options[labelled.group(1).lower()]):
+            correct = labelled.group(1).lower()
+        else:
+            return None, "invalid"
+        repaired = True
+
+    question = {"mcq": mcq, "options": normalized_options, "correct": correct}
+    try:
+        QuizQuestion(**question)
+    except Exception:
+        return None, "invalid"
+    return question, "repaired" if repaired else "valid"
+
+class MCQStreamParser:
+    """Incremental JSON scanner that yields each MCQ object as soon as its closing brace arrives."""
+
+    def __init__(self):
+        self.buffer = ""
+        self.position = 0
+        self.in_string = False
+        self.escaped = False
+        self.object_starts: List[int] = []
+
+    def feed(self, chunk: str) -> List[Dict]:
+        self.buffer += chunk
+        completed = []
+        while self.position < len(self.buffer):
+            char = self.buffer[self.position]
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = True
+            elif char == "{":
+                self.object_starts.append(self.position)
+            elif char == "}" and self.object_starts:
+                start = self.object_starts.pop()
+                # Only inner objects are candidates; the outer wrapper is skipped.
+                if self.object_starts or "mcqs" not in self.buffer[start:start + 12]:
+                    try:
+                        item = json.loads(self.buffer[start:self.position + 1])
+                    except json.JSONDecodeError:
+                        item = None
+                    if isinstance(item, dict) and "mcq" in item:
+                        completed.append(item)
+            self.position += 1
+        return completed
+
+def normalize_text(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", " ", text.lower()).strip()
+
+# Large quizzes are split into batches of at most BATCH_SIZE questions that are
+# generated concurrently, merged with near-duplicate removal and topped up.
+BATCH_SIZE = 8
+MAX_CONCURRENT_BATCHES = 4
+MAX_TOP_UP_ROUNDS = 2
+NEAR_DUPLICATE_THRESHOLD = 0.8
+
+def shingles(text: str, size: int = 3) -> set:
+    words = normalize_text(text).split()
+    if len(words) <= size:
+        return {" ".join(words)}
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+def is_near_duplicate(first: set, second: set) -> bool:
+    if not first or not second:
+        return False
+    return len(first & second) / len(first | second) >= NEAR_DUPLICATE_THRESHOLD
+
+def merge_questions(existing: List[Dict], candidates: List[Dict]) -> List[Dict]:
+    """Return the candidates that are not near-duplicates of existing questions or of each other."""
+    kept_shingles = [shingles(question["mcq"]) for question in existing]
+    accepted = []
+    for question in candidates:
+        if not isinstance(question, dict) or not normalize_text(str(question.get("mcq", ""))):
+            continue
+        candidate_shingles = shingles(question["mcq"])
+        if any(is_near_duplicate(candidate_shingles, kept) for kept in kept_shingles):
+            continue
+        kept_shingles.append(candidate_shingles)
+        accepted.append(question)
+    return accepted
+
+def split_batches(num_questions: int) -> List[int]:
+    full, rest = divmod(num_questions, BATCH_SIZE)
+    return [BATCH_SIZE] * full + ([rest] if rest else [])
+
+# Study material longer than LONG_DOCUMENT_CHARS is split into sections of at
+# most SECTION_CHARS; each section gets a share of the questions proportional
+# to its length and the sections are generated concurrently.
+LONG_DOCUMENT_CHARS = 12000
+SECTION_CHARS = 6000
+MIN_SECTION_CHARS = 500
+MAX_CONCURRENT_SECTIONS = 4
+
+def split_sections(text_content: str) -> List[str]:
+    pieces: List[str] = []
+    for paragraph in re.split(r"\n\s*\n", text_content):
+        paragraph = paragraph.strip()
+        while len(paragraph) > SECTION_CHARS:
+            cut = paragraph.rfind(" ", 0, SECTION_CHARS)
+            cut = cut if cut > 0 else SECTION_CHARS
+            pieces.append(paragraph[:cut])
+            paragraph = paragraph[cut:].strip()
+        if paragraph:
+            pieces.append(paragraph)
+
+    sections: List[str] = []
+    for piece in pieces:
+        if sections and len(sections[-1]) + len(piece) + 2 <= SECTION_CHARS:
+            sections[-1] += "\n\n" + piece
+        else:
+            sections.append(piece)
+
+    # Fold sections too short to stand as a topic into their smaller
+    # neighbour, but never past SECTION_CHARS.
+    index = 0
+    while index < len(sections):
+        if len(sections) > 1 and len(sections[index]) < MIN_SECTION_CHARS:
+            neighbours = [i for i in (index - 1, index + 1) if 0 <= i < len(sections)]
+            target = min(neighbours, key=lambda i: len(sections[i]))
+            if len(sections[target]) + len(sections[index]) + 2 <= SECTION_CHARS:
+                first, second = sorted((target, index))
+                sections[first:second + 1] = [sections[first] + "\n\n" + sections[second]]
+                index = first
+                continue
+        index += 1
+    return sections
 
-def fetch_questions(text_content: str, quiz_level: str, num_questions: int) -> Dict:
+def allocate_questions(sections: List[str], num_questions: int) -> List[int]:
+    """Share num_questions across sections in proportion to their length.
+
+    Rounding the cumulative position keeps the shares spread evenly through the
+    document when there are fewer questions than sections.
+    """
+    total = sum(len(section) for section in sections)
+    counts = []
+    position = 0
+    for section in sections:
+        start = round(num_questions * position / total)
+        position += len(section)
+        counts.append(round(num_questions * position / total) - start)
+    return counts
+
+async def fetch_long_document_questions(text_content: str, quiz_level: str, num_questions: int) -> Dict:
+    sections = split_sections(text_content)
+    counts = allocate_questions(sections, num_questions)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SECTIONS)
+
+    async def run_section(section: str, count: int) -> Dict:
+        if count == 0:
+            return {"mcqs": [], "stats": new_stats()}
+        async with semaphore:
+            # Sections are bounded by SECTION_CHARS, so go straight to the
+            # batched path; a section must never re-enter long-document mode.
+            return await fetch_batched_questions(section, quiz_level, count)
+
+    results = await asyncio.gather(
+        *(run_section(section, count) for section, count in zip(sections, counts)),
+        return_exceptions=True
+    )
+
+    # Merge in document order.
+    questions: List[Dict] = []
+    stats = new_stats()
+    errors = []
+    for result in results:
+        if isinstance(result, Exception):
+            errors.append(result)
+            continue
+        questions.extend(merge_questions(questions, result["mcqs"]))
+        for name, count in result["stats"].items():
+            stats[name] += count
+    if not questions and errors:
+        raise errors[0]
+    return {"mcqs": questions[:num_questions], "stats": stats}
+
+async def fetch_questions(text_content: str, quiz_level: str, num_questions: int) -> Dict:
+    if len(text_content) > LONG_DOCUMENT_CHARS:
+        return await fetch_long_document_questions(text_content, quiz_level, num_questions)
+    return await fetch_batched_questions(text_content, quiz_level, num_questions)
+
+async def fetch_batched_questions(text_content: str, quiz_level: str, num_questions: int) -> Dict:
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_BATCHES)
+
+    async def run_batch(batch_size: int) -> List[Dict]:
+        async with semaphore:
+            return await generate_batch(text_content, quiz_level, batch_size)
+
+    questions: List[Dict] = []
+    stats = new_stats()
+    last_error = None
+    for round_number in range(1 + MAX_TOP_UP_ROUNDS):
+        missing = num_questions - len(questions)
+        if missing <= 0:
+            break
+        # Later rounds only regenerate the count that is still missing.
+        if round_number > 0:
+            stats["regenerated"] += missing
+        results = await asyncio.gather(
+            *(run_batch(batch_size) for batch_size in split_batches(missing)),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                last_error = result
+                continue
+            checked = []
+            for item in result:
+                question, status = validate_question(item)
+                stats[status] += 1
+                if question is not None:
+                    checked.append(question)
+            questions.extend(merge_questions(questions, checked))
+
+    if not questions and last_error is not None:
+        raise last_error
+    return {"mcqs": questions[:num_questions], "stats": stats}
+
+def build_quiz_chain(text_content: str):
     RESPONSE_JSON_CONTENT = {
         "mcqs": [
             {
@@ -116,7 +387,11 @@ def fetch_questions(text_content: str, quiz_level: str, num_questions: int) -> D
         )
 
     chain_ques = prompt_ques | llm
-    response = chain_ques.invoke({
+    return chain_ques, RESPONSE_JSON
+
+async def generate_batch(text_content: str, quiz_level: str, num_questions: int) -> List[Dict]:
+    chain_ques, RESPONSE_JSON = build_quiz_chain(text_content)
+    response = await chain_ques.ainvoke({
         "text_content": text_content,
         "quiz_level": quiz_level,
         "RESPONSE_JSON": RESPONSE_JSON,
@@ -124,8 +399,321 @@ def fetch_questions(text_content: str, quiz_level: str, num_questions: int) -> D
     })
 
     json_parser = JsonOutputParser()
-    json_res = json_parser.parse(response.content)
-    return json_res
+    try:
+        json_res = json_parser.parse(response.content)
+    except Exception:
+        # One malformed item breaks the whole document; salvage the complete ones.
+        salvaged = MCQStreamParser().feed(response.content)
+        if not salvaged:
+            raise
+        return salvaged
+    if isinstance(json_res, list):
+        return json_res
+    return json_res.get("mcqs", [])
+
+STOPWORDS = {"a", "an", "and", "the", "of", "in", "on", "for", "to", "gate", "questions", "question", "pyq", "pyqs"}
+
+def index_tokens(text: str) -> set:
+    tokens = set()
+    for token in normalize_text(text).split():
+        if token in STOPWORDS:
+            continue
+        # Light stemming so "graphs" matches "graph".
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.add(token)
+    return tokens
+
+class PYQCorpus:
+    """Local GATE previous-year questions with an inverted index.
+
+    The dataset is JSON lines (optionally gzipped), one question per line:
+    {"year": 2021, "subject": "...", "topic": "...", "keywords": [...],
+     "difficulty": "Medium", "mcq": "...", "options": {"a": ..., "d": ...},
+     "correct": "a"}. "year" and "difficulty" are optional. The shipped
+    gate_pyq.jsonl.gz is built from pyq/*.jsonl by build_pyq_corpus.py. A
+    missing file yields an empty corpus and topic quizzes fall back to the LLM.
+    """
+
+    def __init__(self, path: str):
+        self.questions: List[Dict] = []
+        self.index: Dict[str, set] = {}
+        if os.path.exists(path):
+            self.load(path)
+
+    def load(self, path: str):
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as corpus_file:
+            for line in corpus_file:
+                if line.strip():
+                    self.add(json.loads(line))
+
+    def add(self, entry: Dict):
+        doc_id = len(self.questions)
+        self.questions.append(entry)
+        fields = [entry.get("topic", ""), entry.get("subject", ""), str(entry.get("year", ""))]
+        fields.extend(entry.get("keywords", []))
+        for token in index_tokens(" ".join(fields)):
+            self.index.setdefault(token, set()).add(doc_id)
+
+    def search(self, topic: str, quiz_level: str, limit: int) -> List[Dict]:
+        query = index_tokens(topic)
+        if not query or not self.questions:
+            return []
+        # Every query token must match one of topic, subject, year or keywords.
+        matches = set.intersection(*(self.index.get(token, set()) for token in query))
+        level = quiz_level.strip().lower()
+        results = []
+        for doc_id in sorted(matches, key=lambda i: (-int(self.questions[i].get("year", 0) or 0), i)):
+            entry = self.questions[doc_id]
+            if entry.get("difficulty") and entry["difficulty"].strip().lower() != level:
+                continue
+            results.append({
+                "mcq": f"{entry['mcq']} [GATE {entry['year']}]" if entry.get("year") else entry["mcq"],
+                "options": entry["options"],
+                "correct": entry["correct"]
+            })
+            if len(results) >= limit:
+                break
+        return results
+
+pyq_corpus = PYQCorpus(
+    os.getenv("GATE_PYQ_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "gate_pyq.jsonl.gz"))
+)
+
+class QuestionBank:
+    """Pools of generated topic questions keyed by (normalized topic, quiz_level).
+
+    Each pool is served from a shuffled queue so consecutive quizzes on the
+    same topic do not repeat until the pool has been exhausted. Pools are
+    seeded from the local PYQ corpus first; the LLM is only called when a
+    pool cannot cover a request, or in the background when it drops below
+    the low-water mark.
+    """
+
+    def __init__(self, max_pool_size: int = 200, low_water: int = 15, batch_size: int = 10):
+        self.max_pool_size = max_pool_size
+        self.low_water = low_water
+        self.batch_size = batch_size
+        self.pools: Dict[Tuple[str, str], List[Dict]] = {}
+        self.queues: Dict[Tuple[str, str], List[int]] = {}
+        self.refills: Dict[Tuple[str, str], asyncio.Task] = {}
+        self.locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        self.seeded: set = set()
+
+    def key(self, topic: str, quiz_level: str) -> Tuple[str, str]:
+        return normalize_text(topic), quiz_level.strip().lower()
+
+    def add(self, key: Tuple[str, str], questions: List[Dict]) -> int:
+        pool = self.pools.setdefault(key, [])
+        added = 0
+        for question in merge_questions(pool, questions):
+            if len(pool) >= self.max_pool_size:
+                break
+            pool.append(question)
+            queue = self.queues.setdefault(key, [])
+            queue.insert(random.randint(0, len(queue)), len(pool) - 1)
+            added += 1
+        return added
+
+    def seed_from_corpus(self, topic: str, quiz_level: str):
+        key = self.key(topic, quiz_level)
+        if key not in self.seeded:
+            self.seeded.add(key)
+            self.add(key, pyq_corpus.search(topic, quiz_level, self.max_pool_size))
+
+    async def fill(self, topic: str, quiz_level: str, num_questions: int, target: Optional[int] = None):
+        key = self.key(topic, quiz_level)
+        async with self.locks.setdefault(key, asyncio.Lock()):
+            # Requests that queued behind another fill usually find the pool
+            # already covers them.
+            if target is not None:
+                missing = target - len(self.pools.get(key, []))
+                if missing <= 0:
+                    return
+                num_questions = max(missing, self.batch_size)
+            quiz_data = await fetch_questions(topic, quiz_level, num_questions)
+            self.add(key, quiz_data.get("mcqs", []))
+
+    def take(self, key: Tuple[str, str], num_questions: int) -> List[Dict]:
+        pool = self.pools.get(key, [])
+        queue = self.queues.setdefault(key, [])
+        served: List[int] = []
+        while len(served) < min(num_questions, len(pool)):
+            if not queue:
+                queue.extend(index for index in range(len(pool)) if index not in served)
+                random.shuffle(queue)
+            served.append(queue.pop())
+        return [pool[index] for index in served]
+
+    def needs_refill(self, key: Tuple[str, str], num_questions: int) -> bool:
+        # A full pool gains nothing from a refill, however large the request.
+        pool_size = len(self.pools.get(key, []))
+        return pool_size < self.max_pool_size and pool_size - num_questions < self.low_water
+
+    def schedule_refill(self, topic: str, quiz_level: str):
+        key = self.key(topic, quiz_level)
+        if key in self.refills and not self.refills[key].done():
+            return
+        self.refills[key] = asyncio.create_task(self.refill(topic, quiz_level))
+
+    async def refill(self, topic: str, quiz_level: str):
+        try:
+            await self.fill(topic, quiz_level, self.batch_size)
+        except Exception as e:
+            print(f"Error refilling question bank for {topic!r}: {str(e)}")
+
+    async def stream_quiz(self, topic: str, quiz_level: str, num_questions: int) -> AsyncIterator[Dict]:
+        """Serve what the pool has immediately, then stream the rest from the LLM into the pool."""
+        key = self.key(topic, quiz_level)
+        self.seed_from_corpus(topic, quiz_level)
+        served = self.take(key, num_questions)
+        for question in served:
+            yield question
+        missing = num_questions - len(served)
+        if missing > 0:
+            async for question in stream_batched_questions(topic, quiz_level, missing, seen=served):
+                self.add(key, [question])
+                yield question
+        if self.needs_refill(key, num_questions):
+            self.schedule_refill(topic, quiz_level)
+
+    async def get_quiz(self, topic: str, quiz_level: str, num_questions: int) -> Dict:
+        key = self.key(topic, quiz_level)
+        self.seed_from_corpus(topic, quiz_level)
+        missing = num_questions - len(self.pools.get(key, []))
+        if missing > 0:
+            try:
+                await self.fill(topic, quiz_level, max(missing, self.batch_size), target=num_questions)
+            except Exception as e:
+                # A short quiz from the bank beats no quiz at all.
+                if not self.pools.get(key):
+                    raise
+                print(f"Error topping up question bank for {topic!r}, serving the bank: {str(e)}")
+        if self.needs_refill(key, num_questions):
+            self.schedule_refill(topic, quiz_level)
+        return {"mcqs": self.take(key, num_questions)}
+
+question_bank = QuestionBank()
+
+QUIZ_LEVELS = ["Easy", "Medium", "Hard"]
+
+async def pregenerate_question_bank(topics: List[str]):
+    for topic in topics:
+        for quiz_level in QUIZ_LEVELS:
+            question_bank.seed_from_corpus(topic, quiz_level)
+            if len(question_bank.pools.get(question_bank.key(topic, quiz_level), [])) >= question_bank.low_water:
+                continue
+            try:
+                await question_bank.fill(topic, quiz_level, question_bank.batch_size)
+            except Exception as e:
+                print(f"Error pre-generating questions for {topic!r} ({quiz_level}): {str(e)}")
+
+@app.on_event("startup")
+async def schedule_pregeneration():
+    topics = [topic.strip() for topic in os.getenv("QUIZ_PREGENERATE_TOPICS", "").split(",") if topic.strip()]
+    if topics:
+        app.state.pregeneration_task = asyncio.create_task(pregenerate_question_bank(topics))
+
+async def stream_batch(text_content: str, quiz_level: str, num_questions: int) -> AsyncIterator[Dict]:
+    chain_ques, RESPONSE_JSON = build_quiz_chain(text_content)
+    parser = MCQStreamParser()
+    async for chunk in chain_ques.astream({
+        "text_content": text_content,
+        "quiz_level": quiz_level,
+        "RESPONSE_JSON": RESPONSE_JSON,
+        "num_questions": num_questions
+    }):
+        for item in parser.feed(chunk.content):
+            question, _ = validate_question(item)
+            if question is not None:
+                yield question
+
+async def merge_streams(
+    sources: List[AsyncIterator[Dict]], emitted: List[Dict], limit: int, errors: List[Exception]
+) -> AsyncIterator[Dict]:
+    """Run question streams concurrently, yielding new de-duplicated questions until emitted reaches limit.
+
+    A failing stream does not stop the others; its exception is appended to errors.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def pump(source: AsyncIterator[Dict]):
+        try:
+            async for item in source:
+                await queue.put(item)
+        except Exception as e:
+            print(f"Error streaming quiz batch: {str(e)}")
+            errors.append(e)
+        finally:
+            await queue.put(None)
+
+    tasks = [asyncio.create_task(pump(source)) for source in sources]
+    running = len(tasks)
+    try:
+        while running and len(emitted) < limit:
+            item = await queue.get()
+            if item is None:
+                running -= 1
+                continue
+            for question in merge_questions(emitted, [item]):
+                emitted.append(question)
+                yield question
+    finally:
+        for task in tasks:
+            task.cancel()
+
+async def stream_batched_questions(
+    text_content: str, quiz_level: str, num_questions: int, seen: Optional[List[Dict]] = None
+) -> AsyncIterator[Dict]:
+    """Stream num_questions validated questions from concurrent batches, skipping duplicates of seen."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_BATCHES)
+    emitted: List[Dict] = list(seen or [])
+    target = len(emitted) + num_questions
+    errors: List[Exception] = []
+
+    async def run_batch(batch_size: int) -> AsyncIterator[Dict]:
+        async with semaphore:
+            async for item in stream_batch(text_content, quiz_level, batch_size):
+                yield item
+
+    for _ in range(1 + MAX_TOP_UP_ROUNDS):
+        missing = target - len(emitted)
+        if missing <= 0:
+            break
+        sources = [run_batch(batch_size) for batch_size in split_batches(missing)]
+        async for question in merge_streams(sources, emitted, target, errors):
+            yield question
+    # Top-up rounds retry failed batches; only a shortfall is worth reporting.
+    if len(emitted) < target and errors:
+        raise errors[-1]
+
+async def stream_long_document_questions(text_content: str, quiz_level: str, num_questions: int) -> AsyncIterator[Dict]:
+    sections = split_sections(text_content)
+    counts = allocate_questions(sections, num_questions)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SECTIONS)
+
+    async def run_section(section: str, count: int) -> AsyncIterator[Dict]:
+        async with semaphore:
+            async for item in stream_batched_questions(section, quiz_level, count):
+                yield item
+
+    sources = [run_section(section, count) for section, count in zip(sections, counts) if count]
+    emitted: List[Dict] = []
+    errors: List[Exception] = []
+    async for question in merge_streams(sources, emitted, num_questions, errors):
+        yield question
+    if len(emitted) < num_questions and errors:
+        raise errors[-1]
+
+async def stream_questions(text_content: str, quiz_level: str, num_questions: int) -> AsyncIterator[Dict]:
+    """Streaming counterpart of fetch_questions: long material is streamed section by section."""
+    if len(text_content) > LONG_DOCUMENT_CHARS:
+        stream = stream_long_document_questions(text_content, quiz_level, num_questions)
+    else:
+        stream = stream_batched_questions(text_content, quiz_level, num_questions)
+    async for question in stream:
+        yield question
 
 @app.get("/", response_class=HTMLResponse)
 async def root():
@@ -170,6 +758,11 @@ async def root():
                 <li><code>quiz_level</code>: Difficulty level (default: "Medium")</li>
             </ul>
         </div>
+
+        <div class="endpoint">
+            <h2>POST /generate-quiz/stream</h2>
+            <p>Same request body as <code>/generate-quiz</code>. Streams NDJSON lines, one per question as soon as it is ready, followed by a <code>done</code> line. Banked and PYQ questions for a topic are sent immediately; long material is streamed section by section.</p>
+        </div>
         
         <p>Check <code>/docs</code> for detailed API documentation.</p>
     </body>
@@ -179,15 +772,43 @@ async def root():
 @app.post("/generate-quiz", response_model=QuizResponse)
 async def generate_quiz(request: QuizRequest):
     try:
-        quiz_data = fetch_questions(
-            request.text_content,
-            request.quiz_level,
-            request.num_questions
-        )
+        if len(request.text_content) > 100:
+            quiz_data = await fetch_questions(
+                request.text_content,
+                request.quiz_level,
+                request.num_questions
+            )
+        else:
+            quiz_data = await question_bank.get_quiz(
+                request.text_content,
+                request.quiz_level,
+                request.num_questions
+            )
         return quiz_data
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/generate-quiz/stream")
+async def generate_quiz_stream(request: QuizRequest):
+    async def event_stream():
+        count = 0
+        # Same routing as /generate-quiz: topics go through the question bank.
+        if len(request.text_content) > 100:
+            questions = stream_questions(request.text_content, request.quiz_level, request.num_questions)
+        else:
+            questions = question_bank.stream_quiz(request.text_content, request.quiz_level, request.num_questions)
+        try:
+            async for question in questions:
+                yield json.dumps({"type": "question", "index": count, "question": question}) + "\n"
+                count += 1
+            if count < request.num_questions:
+                yield json.dumps({"type": "error", "detail": f"Only {count} of {request.num_questions} questions could be generated"}) + "\n"
+        except Exception as e:
+            yield json.dumps({"type": "error", "detail": str(e)}) + "\n"
+        yield json.dumps({"type": "done", "count": count}) + "\n"
+
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="localhost", port=8000)
\ No newline at end of file
@@ -1,5 +1,5 @@
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
 from pydantic import BaseModel
 from fastapi.middleware.cors import CORSMiddleware
 from youtube_transcript_api import YouTubeTranscriptApi
@@ -9,8 +9,17 @@ import os
 from dotenv import load_dotenv
 import uvicorn
 import json
+import re
 import googleapiclient.discovery
-from typing import List
+from googleapiclient.http import HttpMockSequence
+import httplib2
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from collections import OrderedDict
+import asyncio
+import sqlite3
+import time
+import math
+import threading
 
 load_dotenv()
 
@@ -63,88 +72,608 @@ class CompleteSummaryResponse(BaseModel):
     next_steps: list[str]
     recommendations: List[VideoRecommendation]
 
-def extract_transcript(video_url: str) -> tuple:
+class BatchAnalyzeRequest(BaseModel):
+    playlist_url: Optional[str] = None
+    video_urls: List[str] = []
+    rollup: bool = True
+
+def extract_playlist_id(playlist_url: str) -> str:
+    try:
+        return playlist_url.split("list=")[1].split("&")[0]
+    except IndexError:
+        raise HTTPException(status_code=400, detail="Could not find a playlist id in the URL")
+
+def extract_video_id(video_url: str) -> str:
+    try:
+        return video_url.split("v=")[1].split("&")[0]
+    except IndexError:
+        raise HTTPException(status_code=400, detail="Error extracting transcript: could not find a video id in the URL")
+
+def fetch_transcript_segments(video_id: str) -> List[dict]:
     try:
-        video_id = video_url.split("v=")[1].split("&")[0]
-        transcript_text = YouTubeTranscriptApi.get_transcript(video_id,languages=['en'])
-        transcript = " ".join(item["text"] for item in transcript_text)
-        return transcript, video_id
+        return YouTubeTranscriptApi.get_transcript(video_id,languages=['en'])
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error extracting transcript: {str(e)}")
 
+def join_transcript(segments: List[dict]) -> str:
+    return " ".join(item["text"] for item in segments)
+
+def create_llm() -> ChatGroq:
+    return ChatGroq(
+        model_name="llama-3.3-70b-versatile",
+        temperature=0.5,
+        api_key=os.getenv('GROQ_API_KEY')
+    )
+
 def generate_summary(transcript: str) -> dict:
     try:
-        llm = ChatGroq(
-            model_name="llama-3.3-70b-versatile",
-            temperature=0.5,
-            api_key=os.getenv('GROQ_API_KEY')
-        )
+        llm = create_llm()
 
         model = summary_prompt | llm
 
         response = model.invoke(input={'transcript': transcript})
         
-        try:
-            summary_dict = json.loads(response.content)
-        except json.JSONDecodeError:
-            try:
-                summary_dict = eval(response.content)
-            except:
-                text = response.content
-                start = text.find('{')
-                end = text.rfind('}') + 1
-                if start >= 0 and end > start:
-                    json_str = text[start:end]
-                    try:
-                        summary_dict = json.loads(json_str)
-                    except:
-                        raise HTTPException(status_code=500, 
-                                           detail=f"Failed to parse LLM response as JSON or dictionary")
-                else:
-                    raise HTTPException(status_code=500, 
-                                       detail=f"Could not find JSON structure in LLM response")
-
-        return summary_dict
+        return parse_summary_response(response.content)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating summary: {str(e)}")
 
-def get_recommended_videos(video_id: str, topic: str, keywords: list) -> list:
+def parse_summary_response(content: str) -> dict:
     try:
-        youtube = googleapiclient.discovery.build(
-            "youtube", "v3", developerKey=os.getenv("YOUTUBE_API_KEY")
+        summary_dict = json.loads(content)
+    except json.JSONDecodeError:
+        try:
+            summary_dict = eval(content)
+        except:
+            text = content
+            start = text.find('{')
+            end = text.rfind('}') + 1
+            if start >= 0 and end > start:
+                json_str = text[start:end]
+                try:
+                    summary_dict = json.loads(json_str)
+                except:
+                    raise HTTPException(status_code=500, 
+                                       detail=f"Failed to parse LLM response as JSON or dictionary")
+            else:
+                raise HTTPException(status_code=500, 
+                                   detail=f"Could not find JSON structure in LLM response")
+
+    return summary_dict
+
+# One discovery service per process: building it parses the whole API
+# description, which is far slower than the calls made through it.
+# httplib2 connections aren't thread-safe, so real requests use a
+# per-thread Http; an injected transport (see stub_transport) is shared
+# behind a lock instead.
+class YouTubeClient:
+    def __init__(self, api_key: Optional[str], http=None):
+        self.service = googleapiclient.discovery.build(
+            "youtube", "v3", developerKey=api_key, http=http,
+            cache_discovery=False, static_discovery=True
         )
-        
-        search_query = f"{topic} {' '.join(keywords[:3])}"
-        recommended_videos = []
-        
-        search_response = youtube.search().list(
-            q=search_query,
+        self.http = http
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+    def execute(self, request) -> dict:
+        if self.http is not None:
+            with self.lock:
+                return request.execute(http=self.http)
+        if not hasattr(self.local, "http"):
+            self.local.http = httplib2.Http(timeout=YOUTUBE_TIMEOUT)
+        return request.execute(http=self.local.http)
+
+    def search_video_ids(self, query: str, max_results: int) -> List[str]:
+        response = self.execute(self.service.search().list(
+            q=query,
             type="video",
-            part="id,snippet",
-            maxResults=3,
+            part="id",
+            fields="items/id/videoId",
+            maxResults=max_results,
             videoDuration="medium",
             relevanceLanguage="en"
-        ).execute()
-        
-        for item in search_response.get("items", []):
-            if item["id"]["kind"] == "youtube#video":
-                rec_video_id = item["id"]["videoId"]
-                snippet = item["snippet"]
-                
-                recommended_videos.append(
-                    VideoRecommendation(
-                        video_id=rec_video_id,
-                        title=snippet["title"],
-                        channel_title=snippet["channelTitle"],
-                        thumbnail_url=snippet["thumbnails"]["high"]["url"]
-                    )
-                )
-        
-        return recommended_videos
+        ))
+        return [item["id"]["videoId"] for item in response.get("items", []) if "videoId" in item.get("id", {})]
+
+    def video_details(self, video_ids: List[str]) -> List[dict]:
+        # videos.list accepts up to 50 ids per call at one quota unit each call.
+        details = []
+        for i in range(0, len(video_ids), 50):
+            response = self.execute(self.service.videos().list(
+                id=",".join(video_ids[i:i + 50]),
+                part="snippet,statistics",
+                fields="items(id,snippet(title,channelTitle,tags,thumbnails/high/url),statistics(viewCount,likeCount))",
+                maxResults=50
+            ))
+            details.extend(response.get("items", []))
+        return details
+
+    def playlist_video_ids(self, playlist_id: str, limit: int) -> List[str]:
+        video_ids: List[str] = []
+        page_token = None
+        while len(video_ids) < limit:
+            response = self.execute(self.service.playlistItems().list(
+                playlistId=playlist_id,
+                part="contentDetails",
+                fields="nextPageToken,items/contentDetails/videoId",
+                maxResults=50,
+                pageToken=page_token
+            ))
+            video_ids.extend(item["contentDetails"]["videoId"] for item in response.get("items", []))
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                break
+        return video_ids[:limit]
+
+YOUTUBE_TIMEOUT = 10
+RECOMMENDATION_COUNT = 3
+RECOMMENDATION_CANDIDATES = 15
+LIKE_RATIO_PRIOR_VIEWS = 1000
+
+youtube_client: Optional[YouTubeClient] = None
+youtube_client_lock = threading.Lock()
+
+def get_youtube_client() -> YouTubeClient:
+    global youtube_client
+    with youtube_client_lock:
+        if youtube_client is None:
+            youtube_client = YouTubeClient(os.getenv("YOUTUBE_API_KEY"))
+        return youtube_client
+
+def set_youtube_client(client: Optional[YouTubeClient]):
+    global youtube_client
+    with youtube_client_lock:
+        youtube_client = client
+
+def stub_transport(search_items: List[dict], video_items: List[dict]) -> HttpMockSequence:
+    """Local transport answering one search and one videos.list call, for tests:
+    set_youtube_client(YouTubeClient("test", http=stub_transport(...)))"""
+    return HttpMockSequence([
+        ({"status": "200"}, json.dumps({"items": search_items})),
+        ({"status": "200"}, json.dumps({"items": video_items})),
+    ])
+
+def rank_candidates(details: List[dict], keywords: list, exclude_id: str) -> List[dict]:
+    terms = [keyword.lower() for keyword in keywords]
+
+    def score(item: dict) -> float:
+        snippet = item.get("snippet", {})
+        statistics = item.get("statistics", {})
+        views = int(statistics.get("viewCount", 0))
+        likes = int(statistics.get("likeCount", 0))
+        text = " ".join([snippet.get("title", "")] + snippet.get("tags", [])).lower()
+        matches = sum(1 for term in terms if term in text)
+        # The like ratio is smoothed so a handful of views can't produce a
+        # perfect ratio, and capped below the weight of one keyword match.
+        like_ratio = likes / (views + LIKE_RATIO_PRIOR_VIEWS)
+        return matches * 2 + math.log10(views + 1) + min(like_ratio * 20, 1.5)
+
+    candidates = [
+        item for item in details
+        if item.get("id") != exclude_id and item.get("snippet", {}).get("thumbnails", {}).get("high")
+    ]
+    return sorted(candidates, key=score, reverse=True)
+
+def get_recommended_videos(video_id: str, topic: str, keywords: list) -> list:
+    try:
+        client = get_youtube_client()
+        search_query = f"{topic} {' '.join(keywords[:3])}"
+
+        # One search (100 units) for a wider candidate pool, then a single
+        # batched videos.list (1 unit) to re-rank it locally.
+        candidate_ids = client.search_video_ids(search_query, RECOMMENDATION_CANDIDATES)
+        details = client.video_details(candidate_ids)
+
+        return [
+            VideoRecommendation(
+                video_id=item["id"],
+                title=item["snippet"]["title"],
+                channel_title=item["snippet"]["channelTitle"],
+                thumbnail_url=item["snippet"]["thumbnails"]["high"]["url"]
+            )
+            for item in rank_candidates(details, keywords, video_id)[:RECOMMENDATION_COUNT]
+        ]
     except Exception as e:
         print(f"Error getting recommendations: {str(e)}")
         return []
 
+TRANSCRIPT_TTL = 30 * 86400
+SUMMARY_TTL = 30 * 86400
+RECOMMENDATIONS_TTL = 86400
+MEMORY_CACHE_SIZE = 512
+CACHE_PURGE_INTERVAL = 3600
+
+class TieredCache:
+    """In-memory LRU in front of a local sqlite store, with single-flight computes.
+
+    Values are JSON-serialisable and stored per (namespace, key) with an
+    expiry time. Concurrent misses for the same entry share one compute, so a
+    video shared with a whole class is only transcribed and summarised once.
+    """
+
+    def __init__(self, path: str, memory_size: int):
+        self.path = path
+        self.memory_size = memory_size
+        self.memory: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self.inflight: Dict[tuple, asyncio.Task] = {}
+
+    def open(self):
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                )
+            """)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _read(self, cache_key: tuple) -> Optional[tuple]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value, expires_at FROM cache WHERE namespace = ? AND key = ?", cache_key
+            ).fetchone()
+        return (json.loads(row[0]), row[1]) if row else None
+
+    def _write(self, cache_key: tuple, value, expires_at: float):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                (*cache_key, json.dumps(value), expires_at)
+            )
+
+    def purge_expired(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("DELETE FROM cache WHERE expires_at < ?", (time.time(),)).rowcount
+
+    def _remember(self, cache_key: tuple, value, expires_at: float):
+        self.memory[cache_key] = (value, expires_at)
+        self.memory.move_to_end(cache_key)
+        if len(self.memory) > self.memory_size:
+            self.memory.popitem(last=False)
+
+    async def get(self, namespace: str, key: str):
+        cache_key = (namespace, key)
+        entry = self.memory.get(cache_key)
+        if entry is None:
+            entry = await asyncio.to_thread(self._read, cache_key)
+            if entry is not None:
+                self._remember(cache_key, *entry)
+        if entry is None or entry[1] < time.time():
+            return None
+        self.memory.move_to_end(cache_key)
+        return entry[0]
+
+    async def set(self, namespace: str, key: str, value, ttl: float):
+        expires_at = time.time() + ttl
+        self._remember((namespace, key), value, expires_at)
+        await asyncio.to_thread(self._write, (namespace, key), value, expires_at)
+
+    async def _compute_and_store(self, namespace: str, key: str, ttl: float, compute: Callable[[], Awaitable]):
+        try:
+            value = await compute()
+            # None means "nothing worth caching"; the next request recomputes.
+            if value is not None:
+                await self.set(namespace, key, value, ttl)
+            return value
+        finally:
+            self.inflight.pop((namespace, key), None)
+
+    def start_compute(self, namespace: str, key: str, ttl: float, compute: Callable[[], Awaitable]) -> asyncio.Task:
+        """Return the in-flight compute for an entry, starting it if there is none."""
+        cache_key = (namespace, key)
+        if cache_key not in self.inflight:
+            task = asyncio.create_task(self._compute_and_store(namespace, key, ttl, compute))
+            # Streaming listeners don't await the task; keep failures from being logged as unretrieved.
+            task.add_done_callback(lambda done: done.cancelled() or done.exception())
+            self.inflight[cache_key] = task
+        return self.inflight[cache_key]
+
+    async def get_or_compute(self, namespace: str, key: str, ttl: float, compute: Callable[[], Awaitable]):
+        value = await self.get(namespace, key)
+        if value is not None:
+            return value
+        return await asyncio.shield(self.start_compute(namespace, key, ttl, compute))
+
+video_cache = TieredCache(os.getenv("SUMMARY_CACHE_DB", "summary_cache.db"), MEMORY_CACHE_SIZE)
+
+async def purge_expired_cache_entries():
+    while True:
+        try:
+            await asyncio.to_thread(video_cache.purge_expired)
+        except Exception as e:
+            print(f"Error purging expired cache entries: {str(e)}")
+        await asyncio.sleep(CACHE_PURGE_INTERVAL)
+
+@app.on_event("startup")
+async def start_cache_purger():
+    # The cache file is created here rather than on import.
+    video_cache.open()
+    app.state.cache_purger = asyncio.create_task(purge_expired_cache_entries())
+
+@app.on_event("shutdown")
+async def stop_cache_purger():
+    app.state.cache_purger.cancel()
+
+async def get_transcript_segments(video_id: str) -> List[dict]:
+    return await video_cache.get_or_compute(
+        "transcript_segments", video_id, TRANSCRIPT_TTL,
+        lambda: asyncio.to_thread(fetch_transcript_segments, video_id)
+    )
+
+# Transcripts over LONG_TRANSCRIPT_TOKENS are summarised map-reduce style:
+# timestamped chunks of at most CHUNK_TOKENS are condensed concurrently and
+# the notes are reduced into the usual summary structure.
+LONG_TRANSCRIPT_TOKENS = 6000
+CHUNK_TOKENS = 2500
+MAX_CONCURRENT_CHUNKS = 4
+
+chunk_prompt = PromptTemplate.from_template(
+    """
+    Transcript section [{start} - {end}]:
+    {transcript}
+
+    Write 3-5 short bullet points covering the technical content of this section.
+    Then one line starting with "Keywords:" listing at most 5 technical keywords.
+    Don't include words "Speaker" or "Transcript".
+    """
+)
+
+def estimate_tokens(text: str) -> int:
+    # Roughly four characters per token for English text.
+    return len(text) // 4
+
+def format_timestamp(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
+
+def chunk_transcript(segments: List[dict]) -> List[dict]:
+    chunks = []
+    current: List[dict] = []
+    current_tokens = 0
+    for segment in segments:
+        segment_tokens = estimate_tokens(segment["text"]) + 1
+        if current and current_tokens + segment_tokens > CHUNK_TOKENS:
+            chunks.append(current)
+            current, current_tokens = [], 0
+        current.append(segment)
+        current_tokens += segment_tokens
+    if current:
+        chunks.append(current)
+    return [
+        {
+            "start": format_timestamp(chunk[0]["start"]),
+            "end": format_timestamp(chunk[-1]["start"] + chunk[-1].get("duration", 0)),
+            "text": join_transcript(chunk)
+        }
+        for chunk in chunks
+    ]
+
+async def summarise_chunks(segments: List[dict]) -> str:
+    model = chunk_prompt | create_llm()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHUNKS)
+
+    async def summarise_chunk(chunk: dict) -> str:
+        async with semaphore:
+            response = await model.ainvoke({
+                "start": chunk["start"], "end": chunk["end"], "transcript": chunk["text"]
+            })
+        return f"[{chunk['start']} - {chunk['end']}]\n{response.content.strip()}"
+
+    try:
+        notes = await asyncio.gather(*(summarise_chunk(chunk) for chunk in chunk_transcript(segments)))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error generating summary: {str(e)}")
+    return "\n\n".join(notes)
+
+async def summary_input(segments: List[dict]) -> str:
+    # Long transcripts are reduced from their chunk notes with the regular
+    # summary prompt; short ones go to it directly.
+    transcript = join_transcript(segments)
+    if estimate_tokens(transcript) > LONG_TRANSCRIPT_TOKENS:
+        return await summarise_chunks(segments)
+    return transcript
+
+SUMMARY_FIELDS = ["topic", "keywords", "summary", "key_takeaways", "next_steps"]
+
+async def get_summary(video_id: str, segments: List[dict]) -> dict:
+    async def compute():
+        summary = await asyncio.to_thread(generate_summary, await summary_input(segments))
+        missing = [field for field in SUMMARY_FIELDS if field not in summary]
+        if missing:
+            raise HTTPException(status_code=500, detail=f"Error generating summary: missing {', '.join(missing)}")
+        return summary
+
+    return await video_cache.get_or_compute("summary", video_id, SUMMARY_TTL, compute)
+
+class SummaryStreamParser:
+    """Pulls summary fields out of the model's streamed JSON as each value closes.
+
+    Fields are read in SUMMARY_FIELDS order, which is the order the prompt asks
+    for; anything the model writes out of order is left for the final parse.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self.pos = 0
+        self.next_field = 0
+        self.decoder = json.JSONDecoder()
+
+    def feed(self, text: str) -> List[Tuple[str, object]]:
+        self.buffer += text
+        fields = []
+        while self.next_field < len(SUMMARY_FIELDS):
+            field = SUMMARY_FIELDS[self.next_field]
+            match = re.compile(rf'"{field}"\s*:\s*').search(self.buffer, self.pos)
+            if not match:
+                break
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, match.end())
+            except json.JSONDecodeError:
+                # The value is still being streamed.
+                break
+            fields.append((field, value))
+            self.pos = end
+            self.next_field += 1
+        return fields
+
+async def stream_summary(segments: List[dict]):
+    parser = SummaryStreamParser()
+    try:
+        text = await summary_input(segments)
+        model = summary_prompt | create_llm()
+        async for chunk in model.astream({"transcript": text}):
+            for field, value in parser.feed(chunk.content):
+                yield field, value
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error generating summary: {str(e)}")
+
+    if parser.next_field < len(SUMMARY_FIELDS):
+        try:
+            summary = parse_summary_response(parser.buffer)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Error generating summary: {str(e)}")
+        for field in SUMMARY_FIELDS[parser.next_field:]:
+            if field not in summary:
+                raise HTTPException(status_code=500, detail=f"Error generating summary: missing {field}")
+            yield field, summary[field]
+
+class SummaryBroadcast:
+    """One streamed summary generation replayed to every listener.
+
+    The generation runs as the cache's in-flight compute for the video, so
+    concurrent /analyze/stream requests share it and /analyze callers simply
+    await its result.
+    """
+
+    def __init__(self):
+        self.fields: List[Tuple[str, object]] = []
+        self.finished = False
+        self.error: Optional[Exception] = None
+        self.condition = asyncio.Condition()
+
+    async def run(self, fields) -> dict:
+        try:
+            async for field, value in fields:
+                async with self.condition:
+                    self.fields.append((field, value))
+                    self.condition.notify_all()
+            return dict(self.fields)
+        except Exception as e:
+            self.error = e
+            raise
+        finally:
+            async with self.condition:
+                self.finished = True
+                self.condition.notify_all()
+
+    async def listen(self):
+        index = 0
+        while True:
+            async with self.condition:
+                await self.condition.wait_for(lambda: index < len(self.fields) or self.finished)
+                pending = self.fields[index:]
+                finished = self.finished
+            index += len(pending)
+            for field in pending:
+                yield field
+            if finished and index == len(self.fields):
+                if self.error is not None:
+                    raise self.error
+                return
+
+summary_broadcasts: Dict[str, SummaryBroadcast] = {}
+
+async def stream_summary_fields(video_id: str, segments: List[dict]):
+    cached = await video_cache.get("summary", video_id)
+    if cached is not None:
+        for field in SUMMARY_FIELDS:
+            yield field, cached[field]
+        return
+
+    broadcast = summary_broadcasts.get(video_id)
+    if broadcast is None:
+        if ("summary", video_id) in video_cache.inflight:
+            # A blocking /analyze generation is already running; replay its result.
+            summary = await get_summary(video_id, segments)
+            for field in SUMMARY_FIELDS:
+                yield field, summary[field]
+            return
+        broadcast = SummaryBroadcast()
+        summary_broadcasts[video_id] = broadcast
+
+        async def compute():
+            try:
+                return await broadcast.run(stream_summary(segments))
+            finally:
+                summary_broadcasts.pop(video_id, None)
+
+        video_cache.start_compute("summary", video_id, SUMMARY_TTL, compute)
+
+    async for field, value in broadcast.listen():
+        yield field, value
+
+def sse_event(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+async def get_recommendations(video_id: str, topic: str, keywords: list) -> List[VideoRecommendation]:
+    async def compute():
+        videos = await asyncio.to_thread(get_recommended_videos, video_id, topic, keywords)
+        # An empty list usually means the search failed; don't pin it for a day.
+        return [dict(video) for video in videos] or None
+
+    cached = await video_cache.get_or_compute("recommendations", video_id, RECOMMENDATIONS_TTL, compute)
+    return [VideoRecommendation(**video) for video in cached or []]
+
+# Batch analysis: transcripts are cheap to fetch and run wide, summaries
+# are bounded so a 20-video playlist doesn't fan out 20 LLM calls at once
+# (long transcripts still map-reduce within their own slot).
+MAX_BATCH_VIDEOS = 50
+BATCH_TRANSCRIPT_CONCURRENCY = 8
+BATCH_SUMMARY_CONCURRENCY = 4
+
+async def resolve_batch_video_ids(request: BatchAnalyzeRequest) -> List[str]:
+    video_ids = [extract_video_id(url) for url in request.video_urls]
+    if request.playlist_url:
+        playlist_id = extract_playlist_id(request.playlist_url)
+        try:
+            # One id past the limit tells a long playlist apart from a full one.
+            playlist_ids = await asyncio.to_thread(
+                get_youtube_client().playlist_video_ids, playlist_id, MAX_BATCH_VIDEOS + 1
+            )
+        except Exception as e:
+            raise HTTPException(status_code=502, detail=f"Error reading playlist: {str(e)}")
+        if len(playlist_ids) > MAX_BATCH_VIDEOS:
+            raise HTTPException(status_code=400, detail=f"The playlist has more than {MAX_BATCH_VIDEOS} videos; split it into smaller batches")
+        video_ids += playlist_ids
+    # Keep playlist order but drop repeats.
+    video_ids = list(dict.fromkeys(video_ids))
+    if not video_ids:
+        raise HTTPException(status_code=400, detail="Provide a playlist_url or at least one video URL")
+    if len(video_ids) > MAX_BATCH_VIDEOS:
+        raise HTTPException(status_code=400, detail=f"A batch can have at most {MAX_BATCH_VIDEOS} videos")
+    return video_ids
+
+async def generate_rollup(summaries: List[dict]) -> dict:
+    notes = "\n\n".join(
+        f"Video {index}: {summary['topic']}\n" + "\n".join(f"- {point}" for point in summary["summary"])
+        for index, summary in enumerate(summaries, start=1)
+    )
+    rollup = await asyncio.to_thread(generate_summary, notes)
+    recommendations = await asyncio.to_thread(
+        get_recommended_videos, "", rollup.get("topic", ""), rollup.get("keywords", [])
+    )
+    rollup["recommendations"] = [dict(video) for video in recommendations]
+    return rollup
+
 @app.get("/", response_class=HTMLResponse)
 async def root():
     """Root endpoint that returns basic API information"""
@@ -207,6 +736,20 @@ async def root():
             </ul>
         </div>
         
+        <div class="endpoint">
+            <h2>GET /analyze/stream?video_url=...</h2>
+            <p>Same analysis as <code>/analyze</code>, streamed as Server-Sent Events as each section is generated: <code>topic</code> (topic and keywords), <code>summary</code>, <code>key_takeaways</code>, <code>next_steps</code>, then <code>recommendations</code> and <code>done</code>. Failures arrive as an <code>error</code> event.</p>
+        </div>
+        
+        <div class="endpoint">
+            <h2>POST /analyze/batch</h2>
+            <p>Summarize a playlist or a list of videos. Streams one NDJSON line per video as it finishes, then an optional cross-video roll-up with recommendations.</p>
+            <h3>Request Body:</h3>
+            <ul>
+                <li><code>{"playlist_url": "...", "video_urls": ["..."], "rollup": true}</code> (up to 50 videos; longer playlists are rejected with a 400)</li>
+            </ul>
+        </div>
+        
         <div class="endpoint">
             <h2>GET /health</h2>
             <p>Check if the API is operational.</p>
@@ -219,11 +762,12 @@ async def root():
 
 @app.post("/analyze")
 async def analyze_video(video_url: str):
-    transcript, video_id = extract_transcript(video_url)
+    video_id = extract_video_id(video_url)
+    segments = await get_transcript_segments(video_id)
     
-    summary = generate_summary(transcript)
+    summary = await get_summary(video_id, segments)
     
-    recommended_videos = get_recommended_videos(
+    recommended_videos = await get_recommendations(
         video_id=video_id,
         topic=summary["topic"],
         keywords=summary["keywords"]
@@ -240,6 +784,83 @@ async def analyze_video(video_url: str):
     
     return CompleteSummaryResponse(**complete_response)
 
+@app.get("/analyze/stream")
+async def analyze_video_stream(video_url: str):
+    video_id = extract_video_id(video_url)
+    # Transcript errors still come back as a plain HTTP error before the stream opens.
+    segments = await get_transcript_segments(video_id)
+
+    async def event_stream():
+        summary = {}
+        try:
+            async for field, value in stream_summary_fields(video_id, segments):
+                summary[field] = value
+                if field == "keywords":
+                    yield sse_event("topic", {"topic": summary["topic"], "keywords": value})
+                elif field != "topic":
+                    yield sse_event(field, {field: value})
+
+            recommended_videos = await get_recommendations(
+                video_id=video_id,
+                topic=summary["topic"],
+                keywords=summary["keywords"]
+            )
+            yield sse_event("recommendations", {"recommendations": [dict(video) for video in recommended_videos]})
+            yield sse_event("done", {})
+        except HTTPException as e:
+            yield sse_event("error", {"detail": e.detail})
+        except Exception as e:
+            yield sse_event("error", {"detail": str(e)})
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+@app.post("/analyze/batch")
+async def analyze_batch(request: BatchAnalyzeRequest):
+    video_ids = await resolve_batch_video_ids(request)
+    transcript_semaphore = asyncio.Semaphore(BATCH_TRANSCRIPT_CONCURRENCY)
+    summary_semaphore = asyncio.Semaphore(BATCH_SUMMARY_CONCURRENCY)
+
+    async def analyze_one(index: int, video_id: str) -> Tuple[int, str, dict]:
+        try:
+            async with transcript_semaphore:
+                segments = await get_transcript_segments(video_id)
+            async with summary_semaphore:
+                summary = await get_summary(video_id, segments)
+            return index, video_id, {"status": "ok", "summary": summary}
+        except HTTPException as e:
+            return index, video_id, {"status": "error", "detail": e.detail}
+        except Exception as e:
+            # One video's failure must not cancel the rest of the batch.
+            return index, video_id, {"status": "error", "detail": str(e)}
+
+    async def event_stream():
+        yield json.dumps({"type": "start", "videos": len(video_ids)}) + "\n"
+        summaries: List[Optional[dict]] = [None] * len(video_ids)
+        tasks = [asyncio.create_task(analyze_one(*job)) for job in enumerate(video_ids)]
+        try:
+            for done, task in enumerate(asyncio.as_completed(tasks), start=1):
+                index, video_id, result = await task
+                summaries[index] = result.get("summary")
+                yield json.dumps({
+                    "type": "video", "done": done, "total": len(video_ids),
+                    "index": index, "video_id": video_id, **result
+                }) + "\n"
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        finished = [summary for summary in summaries if summary]
+        if request.rollup and len(finished) > 1:
+            try:
+                yield json.dumps({"type": "rollup", **await generate_rollup(finished)}) + "\n"
+            except HTTPException as e:
+                yield json.dumps({"type": "rollup", "status": "error", "detail": e.detail}) + "\n"
+            except Exception as e:
+                yield json.dumps({"type": "rollup", "status": "error", "detail": str(e)}) + "\n"
+        yield json.dumps({"type": "done", "succeeded": len(finished), "failed": len(video_ids) - len(finished)}) + "\n"
+
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
+
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
@@ -420,14 +420,21 @@ const HireBot = () => {
 
   // Start demo interview
   const handleStartDemo = async () => {
-    setSessionId('s1');
     setIsLoading(true);
     
     try {
-      const initialQuestion = "Hello! I'm HireBot, your AI interviewer today. I'll be asking you questions based on your resume. Let's start with: Could you tell me a bit about your experience as a Senior Developer at XYZ Corp?";
-      setMessages([{ role: 'assistant', content: initialQuestion }]);
+      const response = await fetch(`${API_BASE_URL}/demo-session`, {
+        method: 'POST',
+      });
+      if (!response.ok) {
+        const error = await response.json();
+        throw new Error(error.detail || 'Failed to start demo interview');
+      }
+      const data = await response.json();
+      setSessionId(data.session_id);
+      setMessages([{ role: 'assistant', content: data.initial_question }]);
       setAppState('interview');
-      speakText(initialQuestion);
+      speakText(data.initial_question);
     } catch (error) {
       console.error('Demo start error:', error);
       toast.error('Failed to start demo interview');